@@ -17,5 +17,7 @@
 This module defines the base API and Resource classes.
 """
 
-from deepsights.api.api import API, APIKeyAPI, OAuthTokenAPI
+from deepsights.api.api import API, APIKeyAPI, OAuthTokenAPI, RateLimitError
+from deepsights.api._breaker import CircuitOpenError
+from deepsights.api._ratelimit import TokenBucket, throttled
 from deepsights.api.resource import APIResource
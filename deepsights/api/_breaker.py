@@ -0,0 +1,123 @@
+# Copyright 2024 Market Logic Software AG. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+This module contains the circuit breakers that let the API clients fail fast while a backend is down.
+"""
+
+import time
+from typing import Dict, Optional
+from requests.exceptions import RequestException
+
+
+#################################################
+class CircuitOpenError(RequestException):
+    """
+    Raised instead of sending a call while the backend has failed too often in a row.
+    Subclasses `RequestException`, so existing handlers keep catching it.
+    """
+
+
+#################################################
+class CircuitBreaker:
+    """
+    Represents a circuit breaker that opens after a number of consecutive backend failures, rejecting calls
+    until a timeout has passed, and then lets a trial call through to decide whether to close again.
+    It is shared across threads without locking; a race at worst lets an extra trial call through.
+    """
+
+    #######################################
+    def __init__(self, host: str, fail_max: int = 5, reset_timeout: float = 30) -> None:
+        """
+        Initializes the circuit breaker, starting closed.
+
+        Args:
+
+            host (str): The host guarded by the breaker, used in errors.
+            fail_max (int, optional): The number of consecutive failures that open the breaker. Defaults to 5.
+            reset_timeout (float, optional): The time to reject calls once open, in seconds. Defaults to 30.
+        """
+        self.host = host
+        self.fail_max = fail_max
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+
+    #######################################
+    def check(self) -> None:
+        """
+        Checks whether a call may be sent; once the timeout has passed, lets one trial call through
+        and keeps rejecting the others for another timeout.
+
+        Raises:
+
+            CircuitOpenError: If the breaker is open.
+        """
+        opened_at = self._opened_at
+        if opened_at is None:
+            return
+
+        now = time.monotonic()
+        if now - opened_at < self.reset_timeout:
+            raise CircuitOpenError(
+                f"Circuit open for {self.host} after {self._failures} consecutive failures; "
+                f"retrying in {self.reset_timeout - (now - opened_at):.1f} seconds."
+            )
+
+        self._opened_at = now
+
+    #######################################
+    def success(self) -> None:
+        """
+        Records a call answered by the backend, closing the breaker.
+        """
+        if self._failures:
+            self._failures = 0
+            self._opened_at = None
+
+    #######################################
+    def failure(self) -> None:
+        """
+        Records a failed call, i.e. a server error or a failed connection, opening the breaker if there were
+        too many in a row.
+        """
+        self._failures += 1
+        if self._failures >= self.fail_max:
+            self._opened_at = time.monotonic()
+
+
+#################################################
+# breakers by host, shared by all API clients talking to the same host
+_BREAKERS: Dict[str, CircuitBreaker] = {}
+
+
+#################################################
+def get_breaker(host: str) -> CircuitBreaker:
+    """
+    Returns the circuit breaker for the given host, creating it if needed.
+
+    Args:
+
+        host (str): The host the requests are sent to.
+
+    Returns:
+
+        CircuitBreaker: The shared circuit breaker.
+    """
+    breaker = _BREAKERS.get(host)
+    if breaker is None:
+        # setdefault is atomic, so concurrent first calls end up sharing one breaker
+        breaker = _BREAKERS.setdefault(host, CircuitBreaker(host))
+
+    return breaker
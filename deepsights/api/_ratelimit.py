@@ -0,0 +1,314 @@
+# Copyright 2024 Market Logic Software AG. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+This module contains the client-side rate limiting and backoff of the API clients.
+"""
+
+import time
+import random
+import threading
+from collections import deque
+from functools import wraps
+from typing import Callable, Deque, Dict, Optional, Tuple
+from requests import Response
+from requests.exceptions import HTTPError
+
+
+#################################################
+class RateLimitError(HTTPError):
+    """
+    Raised when a call is still rate-limited (429) by the server after all retries, or would have to wait
+    for the client-side rate limit longer than its timeout.
+    Subclasses `HTTPError`, so existing handlers keep catching it.
+    """
+
+
+#################################################
+class TokenBucket:
+    """
+    Represents a token bucket that is refilled continuously and shared across threads.
+    """
+
+    #######################################
+    def __init__(
+        self, calls: int, period: float, max_penalty: Optional[float] = None
+    ) -> None:
+        """
+        Initializes the token bucket, starting full.
+
+        Args:
+
+            calls (int): The number of calls allowed per period; also the burst capacity.
+            period (float): The period in seconds.
+            max_penalty (Optional[float], optional): The longest pause the server can impose on the bucket,
+                in seconds. Defaults to the period.
+        """
+        self.rate = calls / period
+        self.max_penalty = period if max_penalty is None else max_penalty
+        self.capacity = float(calls)
+        self.tokens = float(calls)
+        self.last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    #######################################
+    def acquire(self, timeout: Optional[float] = None) -> None:
+        """
+        Takes one token from the bucket; returns immediately if one is available and sleeps until one is otherwise.
+        The lock is held only for the refill bookkeeping, never while sleeping.
+
+        Args:
+
+            timeout (Optional[float], optional): The longest time to wait for a token, in seconds. Defaults to None,
+                i.e. waiting as long as it takes.
+
+        Raises:
+
+            RateLimitError: If the next token is further away than the timeout, e.g. while the server pauses the bucket.
+        """
+        while True:
+            with self._lock:
+                self._refill()
+
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+
+                wait = (1 - self.tokens) / self.rate
+
+            if timeout is not None and wait > timeout:
+                raise RateLimitError(
+                    f"Rate limited for another {wait:.1f} seconds, longer than the timeout of {timeout} seconds."
+                )
+
+            time.sleep(max(0, wait))
+
+    #######################################
+    def _refill(self) -> None:
+        """
+        Refills the bucket for the time passed; must be called with the lock held.
+        """
+        now = time.monotonic()
+        self.tokens = min(
+            self.capacity, self.tokens + (now - self.last_refill) * self.rate
+        )
+        self.last_refill = now
+
+    #######################################
+    def penalize(self, seconds: float) -> None:
+        """
+        Empties the bucket so that no token is available for the given time, pausing all its callers.
+        The pause is capped at max_penalty, as the server's hint may reach far beyond the bucket's period,
+        e.g. with a daily quota or a reset given as a timestamp.
+
+        Args:
+
+            seconds (float): The time to pause, in seconds.
+        """
+        seconds = min(seconds, self.max_penalty)
+
+        with self._lock:
+            self._refill()
+            self.tokens = min(self.tokens, 1 - seconds * self.rate)
+
+    #######################################
+    def observe(self, response: Response) -> None:
+        """
+        Adjusts the bucket to the server's view of the rate limit, as far as the response tells:
+        a Retry-After on a 429 pauses the bucket, and RateLimit-Remaining/RateLimit-Reset headers
+        cap the tokens to the calls the server still accepts. Pauses are capped at max_penalty.
+
+        Args:
+
+            response (Response): The server's response.
+        """
+        if response.status_code == 429:
+            seconds = _retry_after(response)
+            if seconds is not None:
+                self.penalize(seconds)
+            return
+
+        try:
+            remaining = float(response.headers["RateLimit-Remaining"])
+        except (KeyError, ValueError):
+            return
+
+        if remaining < 1:
+            try:
+                self.penalize(float(response.headers["RateLimit-Reset"]))
+            except (KeyError, ValueError):
+                pass
+            return
+
+        with self._lock:
+            self._refill()
+            self.tokens = min(self.tokens, remaining)
+
+
+#################################################
+class AdaptiveBackoff:
+    """
+    Represents a backoff policy that stretches retry delays by the share of recently rate-limited (429) calls,
+    tracked per host and service, and honors the server's Retry-After header when present.
+    """
+
+    #######################################
+    def __init__(self, window: int = 64) -> None:
+        """
+        Initializes the backoff policy.
+
+        Args:
+
+            window (int, optional): The number of recent outcomes to track per key. Defaults to 64.
+        """
+        self._window = window
+        self._outcomes: Dict[Tuple[str, str], Deque[bool]] = {}
+
+    #######################################
+    def record(self, key: Tuple[str, str], denied: bool) -> None:
+        """
+        Records the outcome of a call.
+
+        Args:
+
+            key (Tuple[str, str]): The host and service called.
+            denied (bool): Whether the call was rate-limited.
+        """
+        outcomes = self._outcomes.get(key)
+        if outcomes is None:
+            # setdefault is atomic, so concurrent first calls end up sharing one deque
+            outcomes = self._outcomes.setdefault(key, deque(maxlen=self._window))
+        outcomes.append(denied)
+
+    #######################################
+    def next_delay(
+        self,
+        key: Tuple[str, str],
+        attempt: int,
+        max_wait: float,
+        response: Optional[Response] = None,
+        max_retry_after: float = 30,
+    ) -> Optional[float]:
+        """
+        Computes the delay before the next attempt.
+
+        Args:
+
+            key (Tuple[str, str]): The host and service called.
+            attempt (int): The number of the failed attempt, starting at 1.
+            max_wait (float): The maximum randomized exponential delay, in seconds.
+            response (Optional[Response], optional): The rate-limited response, if any. Defaults to None.
+            max_retry_after (float, optional): The longest Retry-After worth waiting for, in seconds. Defaults to 30.
+
+        Returns:
+
+            Optional[float]: The delay in seconds, or None if the server asks to wait longer than max_retry_after,
+                e.g. once a daily quota is used up, and the call should fail instead.
+        """
+        retry_after = _retry_after(response)
+        if retry_after is not None:
+            return retry_after if retry_after <= max_retry_after else None
+
+        outcomes = list(self._outcomes.get(key, ()))
+        denial_rate = sum(outcomes) / len(outcomes) if outcomes else 0.0
+
+        return random.uniform(0, min(max_wait, 2**attempt)) * (1 + 2 * denial_rate)
+
+
+#################################################
+def _retry_after(response: Optional[Response]) -> Optional[float]:
+    """
+    Reads the Retry-After header of a response, if given in seconds.
+
+    Args:
+
+        response (Optional[Response]): The response.
+
+    Returns:
+
+        Optional[float]: The delay requested by the server in seconds, or None.
+    """
+    if response is None:
+        return None
+
+    try:
+        return max(0.0, float(response.headers["Retry-After"]))
+    except (KeyError, ValueError):
+        return None
+
+
+#################################################
+# buckets by host and verb, shared by all API clients talking to the same host
+_BUCKETS: Dict[Tuple[str, str], TokenBucket] = {}
+_BUCKETS_LOCK = threading.Lock()
+
+
+#################################################
+def get_bucket(host: str, verb: str, calls: int, period: float) -> TokenBucket:
+    """
+    Returns the token bucket for the given host and verb, creating it if needed.
+
+    Args:
+
+        host (str): The host the requests are sent to.
+        verb (str): The HTTP verb the bucket limits.
+        calls (int): The number of calls allowed per period.
+        period (float): The period in seconds.
+
+    Returns:
+
+        TokenBucket: The shared token bucket.
+    """
+    key = (host, verb)
+
+    # fast path without locking, as the bucket exists for all but the first call
+    bucket = _BUCKETS.get(key)
+    if bucket is not None:
+        return bucket
+
+    with _BUCKETS_LOCK:
+        bucket = _BUCKETS.get(key)
+        if bucket is None:
+            bucket = TokenBucket(calls, period)
+            _BUCKETS[key] = bucket
+
+        return bucket
+
+
+#################################################
+def throttled(calls: int, period: float) -> Callable:
+    """
+    Decorates a function to take a token from a bucket of its own before each call, sleeping until one is available.
+
+    Args:
+
+        calls (int): The number of calls allowed per period.
+        period (float): The period in seconds.
+
+    Returns:
+
+        Callable: The decorator.
+    """
+
+    def decorator(func: Callable) -> Callable:
+        bucket = TokenBucket(calls, period)
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            bucket.acquire()
+            return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
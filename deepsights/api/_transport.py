@@ -0,0 +1,420 @@
+# Copyright 2024 Market Logic Software AG. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""
+This module contains the transport plumbing shared by the API clients: pooled sessions, worker threads,
+pipelines and response streams.
+"""
+
+import os
+import socket
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import TYPE_CHECKING, Callable, Dict, Iterator, List, Tuple
+from http.cookiejar import DefaultCookiePolicy
+from requests import Response, Session
+from requests.adapters import HTTPAdapter
+from requests.exceptions import RequestException
+from urllib3.util import Retry
+from urllib3.connection import HTTPConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+if TYPE_CHECKING:
+    from deepsights.api.api import API
+
+# log via the module logger; the root logger functions would install a default handler in the host application
+logger = logging.getLogger(__name__)
+
+
+#################################################
+# sessions shared by all API clients with the same endpoint base and pool sizes, to reuse live connections
+_SESSIONS: Dict[Tuple[str, int, int], Session] = {}
+_SESSIONS_LOCK = threading.Lock()
+
+# adapters shared by all sessions with the same pool sizes, so clients for different endpoint bases on the same
+# host (e.g. the resolver and the content store) share their pooled connections
+_ADAPTERS: Dict[Tuple[int, int], HTTPAdapter] = {}
+
+# default pool sizes; a pool per host is cached, and the clients talk to a handful of hosts only,
+# while the connections per host are sized for callers fanning out over many threads
+DEFAULT_POOL_CONNECTIONS = 10
+DEFAULT_POOL_MAXSIZE = max(100, (os.cpu_count() or 1) * 4)
+
+# worker threads running the async calls, per shared session; sized like its pool, so async callers queue
+# for a thread instead of overflowing the pool or starving the event loop's default executor
+_EXECUTORS: Dict[Tuple[str, int, int], ThreadPoolExecutor] = {}
+
+
+#################################################
+def warm_up(session: Session, endpoint_base: str) -> None:
+    """
+    Opens a pooled connection to the endpoint base, so the TCP/TLS handshake is done before the first real request.
+
+    Args:
+
+        session (Session): The session whose pool to warm up.
+        endpoint_base (str): The normalized base URL of the API endpoint.
+    """
+    try:
+        session.head(endpoint_base, timeout=5)
+    except RequestException:
+        # best effort only; the first real request will connect and report errors as usual
+        logger.debug("Warm-up of %s failed", endpoint_base)
+
+
+#################################################
+# keep-alive probes after 60 seconds of idling and every 30 seconds after, where the platform lets us tune them;
+# the system defaults wait two hours, longer than most middleboxes keep idle connections
+_KEEPALIVE_OPTIONS = [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)] + [
+    (socket.IPPROTO_TCP, getattr(socket, name), value)
+    for name, value in (("TCP_KEEPIDLE", 60), ("TCP_KEEPINTVL", 30))
+    if hasattr(socket, name)
+]
+
+
+#################################################
+class _HTTPConnectionPool(HTTPConnectionPool):
+    """
+    Represents a connection pool that logs a warning the first time a caller finds all its connections in use.
+    The caller then opens a short-lived connection beyond the pool, which is discarded after the call.
+    """
+
+    _exhaustion_logged = False
+
+    #######################################
+    def _get_conn(self, timeout=None):
+        """
+        Takes a pooled connection, or opens a new one if none is free, logging a warning the first time.
+
+        Args:
+
+            timeout (float, optional): The time to wait for a free connection in blocking pools. Defaults to None.
+
+        Returns:
+
+            The connection.
+        """
+        pool = self.pool
+        if not self._exhaustion_logged and pool is not None and pool.empty():
+            self._exhaustion_logged = True
+            logger.warning(
+                "All %d pooled connections to %s are in use; further concurrent calls open short-lived connections. "
+                "Raise pool_maxsize or the DEEPSIGHTS_POOL_MAXSIZE environment variable to pool them.",
+                pool.maxsize,
+                self.host,
+            )
+
+        return super()._get_conn(timeout)
+
+
+#################################################
+class _HTTPSConnectionPool(_HTTPConnectionPool, HTTPSConnectionPool):
+    """
+    Represents an HTTPS connection pool that logs a warning the first time a caller finds all its connections in use.
+    """
+
+
+#################################################
+class _KeepAliveAdapter(HTTPAdapter):
+    """
+    Represents an HTTP adapter whose sockets send TCP keep-alive probes, so idle pooled connections
+    are not silently dropped by middleboxes between polls. TCP_NODELAY is already set by urllib3.
+    Its pools log a warning once they are exhausted.
+    """
+
+    #######################################
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs.setdefault(
+            "socket_options",
+            HTTPConnection.default_socket_options + _KEEPALIVE_OPTIONS,
+        )
+        super().init_poolmanager(*args, **kwargs)
+
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _HTTPConnectionPool,
+            "https": _HTTPSConnectionPool,
+        }
+
+
+#################################################
+def _get_adapter(pool_connections: int, pool_maxsize: int) -> HTTPAdapter:
+    """
+    Returns the adapter shared by all sessions with the given pool sizes, creating it if needed.
+    Must be called with the sessions lock held.
+
+    Args:
+
+        pool_connections (int): The number of connection pools to cache, one per host.
+        pool_maxsize (int): The maximum number of connections to keep alive per host.
+
+    Returns:
+
+        HTTPAdapter: The shared adapter.
+    """
+    key = (pool_connections, pool_maxsize)
+
+    adapter = _ADAPTERS.get(key)
+    if adapter is None:
+        # size the pools for concurrent callers; callers beyond open short-lived connections rather than block,
+        # as requests cannot bound the wait for a free connection, and held streams would otherwise deadlock it;
+        # retry failed connection attempts, which never reached the server;
+        # rate-limited responses are left to the adaptive backoff of the API methods
+        adapter = _KeepAliveAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            max_retries=Retry(
+                total=3,
+                read=False,
+                redirect=False,
+                backoff_factor=0.1,
+                respect_retry_after_header=False,
+            ),
+        )
+        _ADAPTERS[key] = adapter
+
+    return adapter
+
+
+#################################################
+def get_session(endpoint_base: str, pool_connections: int, pool_maxsize: int) -> Session:
+    """
+    Returns the session shared by all API clients for the given endpoint base and pool sizes, creating it if needed.
+
+    Args:
+
+        endpoint_base (str): The normalized base URL of the API endpoint.
+        pool_connections (int): The number of connection pools to cache, one per host.
+        pool_maxsize (int): The maximum number of connections to keep alive per host.
+
+    Returns:
+
+        Session: The shared session.
+    """
+    key = (endpoint_base, pool_connections, pool_maxsize)
+
+    with _SESSIONS_LOCK:
+        session = _SESSIONS.get(key)
+        if session is None:
+            session = Session()
+
+            adapter = _get_adapter(pool_connections, pool_maxsize)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+
+            # never store cookies, as the session is shared by clients with different credentials
+            session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+
+            _SESSIONS[key] = session
+
+            # connect in the background, so the handshake overlaps with the caller's own setup
+            threading.Thread(
+                target=warm_up, args=(session, endpoint_base), daemon=True
+            ).start()
+
+        return session
+
+
+#################################################
+def get_executor(
+    endpoint_base: str, pool_connections: int, pool_maxsize: int
+) -> ThreadPoolExecutor:
+    """
+    Returns the executor running the async calls of all API clients for the given endpoint base and pool sizes,
+    creating it if needed.
+
+    Args:
+
+        endpoint_base (str): The normalized base URL of the API endpoint.
+        pool_connections (int): The number of connection pools to cache, one per host.
+        pool_maxsize (int): The maximum number of connections to keep alive per host.
+
+    Returns:
+
+        ThreadPoolExecutor: The shared executor.
+    """
+    key = (endpoint_base, pool_connections, pool_maxsize)
+
+    with _SESSIONS_LOCK:
+        executor = _EXECUTORS.get(key)
+        if executor is None:
+            executor = ThreadPoolExecutor(
+                max_workers=pool_maxsize, thread_name_prefix="deepsights-api"
+            )
+            _EXECUTORS[key] = executor
+
+        return executor
+
+
+#################################################
+class Pipeline:
+    """
+    Represents a batch of calls of an API client, running concurrently on the worker threads of its session.
+    """
+
+    #######################################
+    def __init__(self, api: "API", executor: ThreadPoolExecutor) -> None:
+        """
+        Initializes the pipeline.
+
+        Args:
+
+            api (API): The API client to send the calls with.
+            executor (ThreadPoolExecutor): The executor to run the calls on.
+        """
+        self._api = api
+        self._executor = executor
+        self._futures: List[Future] = []
+
+    #######################################
+    def _submit(self, fun: Callable, *args, **kwargs) -> Future:
+        """
+        Queues a call and records its future, so the pipeline can wait for it.
+
+        Args:
+
+            fun (Callable): The blocking call.
+            *args: The positional arguments of the call.
+            **kwargs: The keyword arguments of the call.
+
+        Returns:
+
+            Future: The future result of the call.
+        """
+        future = self._executor.submit(fun, *args, **kwargs)
+        self._futures.append(future)
+
+        return future
+
+    #######################################
+    def get(self, path: str, **kwargs) -> Future:
+        """
+        Queues a GET request; see `API.get` for the arguments.
+
+        Returns:
+
+            Future: The future JSON body of the server's response.
+        """
+        return self._submit(self._api.get, path, **kwargs)
+
+    #######################################
+    def get_content(self, path: str, **kwargs) -> Future:
+        """
+        Queues a GET request for the raw response body; see `API.get_content` for the arguments.
+
+        Returns:
+
+            Future: The future raw body of the server's response.
+        """
+        return self._submit(self._api.get_content, path, **kwargs)
+
+    #######################################
+    def post(self, path: str, body: Dict, **kwargs) -> Future:
+        """
+        Queues a POST request; see `API.post` for the arguments.
+
+        Returns:
+
+            Future: The future JSON body of the server's response.
+        """
+        return self._submit(self._api.post, path, body, **kwargs)
+
+    #######################################
+    def delete(self, path: str, **kwargs) -> Future:
+        """
+        Queues a DELETE request; see `API.delete` for the arguments.
+
+        Returns:
+
+            Future: The future completion of the request.
+        """
+        return self._submit(self._api.delete, path, **kwargs)
+
+    #######################################
+    def wait(self) -> None:
+        """
+        Waits for all queued calls to complete; errors are left to the futures' `result()`.
+        """
+        wait(self._futures)
+
+
+#################################################
+class ResponseStream:
+    """
+    Represents the body of a streamed response as an iterator over its chunks. The response is closed, releasing
+    its connection, once the body is consumed or the stream is closed, even if iteration never started.
+    """
+
+    #######################################
+    def __init__(self, response: Response, chunk_size: int) -> None:
+        """
+        Initializes the stream.
+
+        Args:
+
+            response (Response): The streamed response, not yet consumed.
+            chunk_size (int): The size of the chunks to yield, in bytes.
+        """
+        self._response = response
+        self._chunks = response.iter_content(chunk_size=chunk_size)
+
+    #######################################
+    def __iter__(self) -> Iterator[bytes]:
+        return self
+
+    #######################################
+    def __next__(self) -> bytes:
+        try:
+            return next(self._chunks)
+        except BaseException:
+            # consumed or failed; either way the connection is done with
+            self.close()
+            raise
+
+    #######################################
+    def close(self) -> None:
+        """
+        Closes the response, releasing its connection.
+        """
+        self._response.close()
+
+    #######################################
+    def __enter__(self) -> "ResponseStream":
+        return self
+
+    #######################################
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    #######################################
+    def __del__(self) -> None:
+        # dropped without being consumed or closed
+        self.close()
+
+
+#################################################
+def close_sessions() -> None:
+    """
+    Closes all shared sessions, releasing their pooled connections and async worker threads.
+    """
+    with _SESSIONS_LOCK:
+        for session in _SESSIONS.values():
+            session.close()
+        _SESSIONS.clear()
+        _ADAPTERS.clear()
+
+        for executor in _EXECUTORS.values():
+            executor.shutdown(wait=False)
+        _EXECUTORS.clear()
@@ -17,17 +17,201 @@ This module contains base API client classes.
 """
 
 import os
+import math
+import time
+import asyncio
 import logging
-from typing import Dict
-from tenacity import (
-    retry,
-    stop_after_attempt,
-    wait_random_exponential,
-    retry_if_exception_type,
+from contextlib import contextmanager
+from functools import lru_cache, partial
+from typing import BinaryIO, Callable, Dict, Iterator
+from urllib.parse import urlparse
+from requests import PreparedRequest, Response
+from requests.sessions import merge_setting
+from requests.structures import CaseInsensitiveDict
+from requests.exceptions import ConnectionError as RequestsConnectionError
+from requests.exceptions import HTTPError, Timeout
+from deepsights.api._breaker import get_breaker
+from deepsights.api._ratelimit import AdaptiveBackoff, RateLimitError, get_bucket
+from deepsights.api._transport import (
+    DEFAULT_POOL_CONNECTIONS,
+    DEFAULT_POOL_MAXSIZE,
+    Pipeline,
+    ResponseStream,
+    close_sessions,
+    get_executor,
+    get_session,
+    warm_up,
 )
-from requests import Session
-from requests.exceptions import Timeout
-from ratelimit import limits, sleep_and_retry
+from deepsights.utils import run_in_parallel
+
+
+#################################################
+def _json_default(obj):
+    """
+    Serializes the values JSON does not know natively, i.e. arrays such as numpy arrays or `array.array`.
+
+    Args:
+
+        obj: The value to serialize.
+
+    Returns:
+
+        list: The array's items.
+
+    Raises:
+
+        TypeError: If the value cannot be serialized.
+    """
+    if hasattr(obj, "tolist"):
+        return obj.tolist()
+
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+#################################################
+def _check_finite(obj) -> None:
+    """
+    Checks that a value holds no NaN or infinite floats, which JSON cannot represent.
+    Lists and arrays of numbers are checked by their sum, which is finite only if all items are;
+    numpy scalars are checked as the number they stand for.
+
+    Args:
+
+        obj: The value to check.
+
+    Raises:
+
+        ValueError: If the value holds a NaN or infinite float.
+    """
+    if isinstance(obj, float):
+        if not math.isfinite(obj):
+            raise ValueError("Out of range float values are not JSON compliant")
+    elif isinstance(obj, dict):
+        for value in obj.values():
+            _check_finite(value)
+    elif isinstance(obj, (list, tuple)) or hasattr(obj, "tolist"):
+        try:
+            if math.isfinite(math.fsum(obj)):
+                return
+        except (TypeError, ValueError, OverflowError):
+            # not all numbers, or a sum beyond the float range
+            pass
+
+        # numpy scalars and 0-d arrays turn into a plain number rather than a list
+        items = obj.tolist() if hasattr(obj, "tolist") else obj
+        if not isinstance(items, (list, tuple)):
+            _check_finite(items)
+            return
+
+        for item in items:
+            _check_finite(item)
+
+
+# use the faster orjson parser and serializer if installed (deepsights-api[speedups]); orjson writes numpy arrays
+# of native types directly, without a list of Python floats in between
+try:
+    from orjson import OPT_SERIALIZE_NUMPY, dumps as _orjson_dumps, loads as json_loads
+
+    def json_dumps(obj) -> bytes:
+        """
+        Serializes a value to compact JSON, writing arrays such as numpy arrays as lists.
+
+        Args:
+
+            obj: The value to serialize.
+
+        Returns:
+
+            bytes: The UTF-8 encoded JSON.
+
+        Raises:
+
+            ValueError: If the value holds a NaN or infinite float.
+            TypeError: If the value cannot be serialized.
+        """
+        # orjson writes NaN and infinity as null; reject them like the standard library does
+        _check_finite(obj)
+        return _orjson_dumps(obj, default=_json_default, option=OPT_SERIALIZE_NUMPY)
+
+except ImportError:
+    import json
+    from json import loads as json_loads
+
+    def json_dumps(obj) -> bytes:
+        """
+        Serializes a value to compact JSON, writing arrays such as numpy arrays as lists.
+
+        Args:
+
+            obj: The value to serialize.
+
+        Returns:
+
+            bytes: The UTF-8 encoded JSON.
+
+        Raises:
+
+            ValueError: If the value holds a NaN or infinite float.
+            TypeError: If the value cannot be serialized.
+        """
+        return json.dumps(
+            obj, separators=(",", ":"), allow_nan=False, default=_json_default
+        ).encode()
+
+
+# client-side rate limits per verb and host, as (calls, period in seconds)
+_RATE_LIMITS = {"GET": (1000, 60), "POST": (100, 60), "DELETE": (1000, 60)}
+
+# transient gateway errors worth retrying; only for idempotent verbs, as the server may have acted on the request
+_GATEWAY_STATUSCODES = frozenset((502, 503, 504))
+_IDEMPOTENT_METHODS = frozenset(("GET", "DELETE"))
+
+# backoff between attempts, shared by all API clients; randomized exponential delays are capped at _MAX_WAIT seconds,
+# and calls whose Retry-After exceeds _MAX_RETRY_AFTER seconds fail at once rather than blocking the caller
+_BACKOFF = AdaptiveBackoff()
+_MAX_WAIT = 5
+_MAX_RETRY_AFTER = 30
+
+# log via the module logger; the root logger functions would install a default handler in the host application
+logger = logging.getLogger(__name__)
+
+
+#################################################
+def _decode_json(response: Response) -> Dict:
+    """
+    Decodes the JSON body of a response; empty bodies, e.g. of 202/204 responses, decode to an empty dict.
+
+    Args:
+
+        response (Response): The response to decode.
+
+    Returns:
+
+        Dict: The decoded body.
+    """
+    content = response.content
+    if not content:
+        return {}
+
+    return json_loads(content)
+
+
+#################################################
+@lru_cache(maxsize=512)
+def _join_endpoint(endpoint_base: str, path: str) -> str:
+    """
+    Joins an endpoint base and a path; cached, as clients hit the same few paths over and over.
+
+    Args:
+
+        endpoint_base (str): The normalized base URL of the API endpoint.
+        path (str): The path to be appended to the base endpoint.
+
+    Returns:
+
+        str: The full endpoint URL.
+    """
+    return endpoint_base + path.strip("/")
 
 
 #################################################
@@ -37,19 +221,128 @@ class API:
     """
 
     #######################################
-    def __init__(self, endpoint_base: str) -> None:
+    def __init__(
+        self,
+        endpoint_base: str,
+        pool_connections: int = None,
+        pool_maxsize: int = None,
+    ) -> None:
         """
         Initializes the API client.
 
         Args:
 
             endpoint_base (str): The base URL of the API endpoint.
+            pool_connections (int, optional): The number of connection pools to cache, one per host.
+                Defaults to the DEEPSIGHTS_POOL_CONNECTIONS environment variable, or 10.
+            pool_maxsize (int, optional): The maximum number of connections to keep alive per host; callers beyond
+                open short-lived connections. Defaults to the DEEPSIGHTS_POOL_MAXSIZE environment variable,
+                or four per CPU and at least 100.
         """
 
         # record endpoint base
         self._endpoint_base = endpoint_base
         if not self._endpoint_base.endswith("/"):
             self._endpoint_base += "/"
+        self._host = urlparse(self._endpoint_base).netloc
+
+        # size the pools; raise via the environment for applications calling from many threads
+        if pool_connections is None:
+            pool_connections = int(
+                os.environ.get("DEEPSIGHTS_POOL_CONNECTIONS", DEFAULT_POOL_CONNECTIONS)
+            )
+        if pool_maxsize is None:
+            pool_maxsize = int(
+                os.environ.get("DEEPSIGHTS_POOL_MAXSIZE", DEFAULT_POOL_MAXSIZE)
+            )
+
+        # use the shared session; credentials are sent as per-request headers
+        self._session = get_session(
+            self._endpoint_base, pool_connections, pool_maxsize
+        )
+        self._send = self._session.send
+        self._pool_connections = pool_connections
+        self._pool_maxsize = pool_maxsize
+        self._headers = {}
+
+        # resolve proxies and TLS settings from the environment once, rather than on every request
+        self._send_settings = self._session.merge_environment_settings(
+            self._endpoint_base, {}, None, None, None
+        )
+        del self._send_settings["stream"]
+
+    #######################################
+    @property
+    def _headers(self) -> Dict:
+        """
+        The headers sent with every request of this client, e.g. its credentials.
+        """
+        return self._client_headers
+
+    #######################################
+    @_headers.setter
+    def _headers(self, headers: Dict) -> None:
+        # merge with the session's default headers once, rather than on every request
+        self._client_headers = headers
+        self._request_headers = merge_setting(
+            headers, self._session.headers, dict_class=CaseInsensitiveDict
+        )
+        self._json_request_headers = CaseInsensitiveDict(self._request_headers)
+        self._json_request_headers["Content-Type"] = "application/json"
+
+    #######################################
+    def warmup(self, connections: int = 1) -> None:
+        """
+        Opens pooled connections to the endpoint base ahead of time, so the first calls skip the TCP/TLS handshake.
+        New sessions already open one connection in the background; use this before a burst of parallel calls.
+
+        Args:
+
+            connections (int, optional): The number of connections to open, capped at the pool size. Defaults to 1.
+        """
+        connections = max(1, min(connections, self._pool_maxsize))
+
+        run_in_parallel(
+            lambda _: warm_up(self._session, self._endpoint_base),
+            range(connections),
+            max_workers=connections,
+        )
+
+    #######################################
+    @contextmanager
+    def pipeline(self) -> Iterator[Pipeline]:
+        """
+        Runs a batch of calls concurrently over the pooled connections of the session, e.g.
+
+            with api.pipeline() as p:
+                first, second = p.get("path/1"), p.get("path/2")
+            print(first.result(), second.result())
+
+        The calls return futures, and leaving the block waits for all of them; errors are raised by `result()`.
+
+        Returns:
+
+            Iterator[Pipeline]: The pipeline to queue calls on.
+        """
+        pipeline = Pipeline(
+            self,
+            get_executor(
+                self._endpoint_base, self._pool_connections, self._pool_maxsize
+            ),
+        )
+        try:
+            yield pipeline
+        finally:
+            pipeline.wait()
+
+    #######################################
+    @classmethod
+    def close_sessions(cls) -> None:
+        """
+        Closes all sessions shared by the API clients, releasing their pooled connections and async worker threads.
+        Clients created afterwards will open new sessions; use e.g. on application shutdown.
+        """
+        close_sessions()
 
     #######################################
     def _endpoint(self, path: str) -> str:
@@ -64,18 +357,153 @@ class API:
 
             str: The full endpoint URL.
         """
-        return self._endpoint_base + path.strip("/")
+        return _join_endpoint(self._endpoint_base, path)
+
+    #######################################
+    def _request(
+        self,
+        method: str,
+        path: str,
+        params: Dict = None,
+        body: Dict = None,
+        timeout=15,
+        expected_statuscodes=(),
+        stream: bool = False,
+        attempts: int = 3,
+    ) -> Response:
+        """
+        Sends a request, applying the client-side rate limit of its verb and retrying timeouts, rate-limited (429)
+        responses and, for GET and DELETE, gateway errors (502/503/504) with adaptive backoff. Calls failing with
+        a server error, a timeout or a failed connection after all attempts count once towards the circuit breaker
+        of the host, which rejects calls while it is open.
+        All verb methods go through here.
+
+        Args:
+
+            method (str): The HTTP verb of the request.
+            path (str): The path to send the request to.
+            params (Dict, optional): Optional parameters to include in the request. Defaults to None.
+            body (Dict, optional): The JSON body to include in the request. Defaults to None.
+            timeout (int, optional): The timeout in seconds for the request. Defaults to 15.
+            expected_statuscodes (Collection[int], optional): Status codes to accept besides 200. Defaults to none.
+            stream (bool, optional): Whether to defer downloading the response body. Defaults to False.
+            attempts (int, optional): The maximum number of attempts. Defaults to 3.
+
+        Returns:
+
+            Response: The server's response.
+
+        Raises:
+
+            RateLimitError: If the request is still rate-limited after the last attempt, the server asks
+                to retry after more than 30 seconds, or the client-side rate limit would wait longer than the timeout.
+            HTTPError: If the request fails with a non-200 status code that is not expected.
+            Timeout: If the last attempt times out.
+            CircuitOpenError: If the host has failed too often in a row.
+        """
+        calls, period = _RATE_LIMITS[method]
+        bucket = get_bucket(self._host, method, calls, period)
+        breaker = get_breaker(self._host)
+        key = (self._host, path.strip("/").split("/", 1)[0])
+
+        # fail rather than wait for the rate limit longer than the call itself may take
+        max_acquire_wait = (
+            sum(filter(None, timeout)) if isinstance(timeout, tuple) else timeout
+        )
+
+        # prepare once, skipping the session's per-request merging of headers, cookies and environment
+        request = PreparedRequest()
+        if body is None:
+            request.prepare(
+                method=method,
+                url=self._endpoint(path),
+                headers=self._request_headers,
+                params=params,
+            )
+        else:
+            request.prepare(
+                method=method,
+                url=self._endpoint(path),
+                headers=self._json_request_headers,
+                params=params,
+                data=json_dumps(body),
+            )
+
+        for attempt in range(1, attempts + 1):
+            breaker.check()
+            bucket.acquire(max_acquire_wait)
+
+            try:
+                response = self._send(
+                    request, timeout=timeout, stream=stream, **self._send_settings
+                )
+            except Timeout:
+                if attempt == attempts:
+                    breaker.failure()
+                    raise
+                time.sleep(_BACKOFF.next_delay(key, attempt, _MAX_WAIT))
+                continue
+            except RequestsConnectionError:
+                breaker.failure()
+                raise
+
+            bucket.observe(response)
+
+            status_code = response.status_code
+            if status_code == 200 or (
+                expected_statuscodes and status_code in expected_statuscodes
+            ):
+                breaker.success()
+                _BACKOFF.record(key, False)
+                return response
+
+            denied = status_code == 429
+            _BACKOFF.record(key, denied)
+
+            delay = None
+            if attempt < attempts and (
+                denied
+                or (
+                    status_code in _GATEWAY_STATUSCODES
+                    and method in _IDEMPOTENT_METHODS
+                )
+            ):
+                delay = _BACKOFF.next_delay(
+                    key, attempt, _MAX_WAIT, response, _MAX_RETRY_AFTER
+                )
+
+            if delay is None:
+                # the call ends here, and counts towards the breaker once, however many attempts it took
+                if status_code >= 500:
+                    breaker.failure()
+                else:
+                    breaker.success()
+
+                logger.error(
+                    "%s %s failed with status code %s",
+                    method,
+                    path,
+                    status_code,
+                )
+                if stream:
+                    response.close()
+                if status_code >= 400:
+                    raise (RateLimitError if denied else HTTPError)(
+                        f"{status_code} {'Client' if status_code < 500 else 'Server'} Error: "
+                        f"{response.reason} for url: {response.url}",
+                        response=response,
+                    )
+                return response
+
+            response.close()
+            time.sleep(delay)
+
+        # the last attempt returns or raises, so this is only reached without any attempt
+        raise ValueError("At least one attempt is required.")
 
     #######################################
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_random_exponential(max=5),
-        retry=retry_if_exception_type(Timeout),
-    )
-    @sleep_and_retry
-    @limits(calls=1000, period=60)
     def get(
-        self, path: str, params: Dict = None, timeout=15, expected_statuscodes=[]
+        self, path: str, params: Dict = None, timeout=15, expected_statuscodes=()
     ) -> Dict:
         """
         Sends a GET request to the specified path with optional parameters.
@@ -84,7 +512,7 @@ class API:
             path (str): The path to send the GET request to.
             params (Dict, optional): Optional parameters to include in the request. Defaults to None.
             timeout (int, optional): The timeout in seconds for the request. Defaults to 15.
-            expected_statuscodes (List[int], optional): List of expected status codes. Defaults to an empty list.
+            expected_statuscodes (Collection[int], optional): Status codes to accept besides 200. Defaults to none.
 
         Returns:
             The JSON body of the server's response to the request.
@@ -92,36 +520,113 @@ class API:
         Raises:
             HTTPError: If the GET request fails with a non-200 status code and not in the expected_statuscodes list.
         """
-        response = self._session.get(
-            self._endpoint(path), params=params, timeout=timeout
+        response = self._request(
+            "GET",
+            path,
+            params=params,
+            timeout=timeout,
+            expected_statuscodes=expected_statuscodes,
         )
 
-        if (
-            response.status_code != 200
-            and not response.status_code in expected_statuscodes
-        ):
-            logging.error(
-                "GET %s failed with status code %s", path, response.status_code
-            )
+        return _decode_json(response)
+
+    #######################################
+    def get_content(
+        self, path: str, params: Dict = None, timeout=15, expected_statuscodes=()
+    ) -> bytes:
+        """
+        Sends a GET request to the specified path with optional parameters and returns the raw response body.
+        Use this to hand the body to a parser directly, e.g. pydantic's `model_validate_json`.
+
+        Args:
+            path (str): The path to send the GET request to.
+            params (Dict, optional): Optional parameters to include in the request. Defaults to None.
+            timeout (int, optional): The timeout in seconds for the request. Defaults to 15.
+            expected_statuscodes (Collection[int], optional): Status codes to accept besides 200. Defaults to none.
+
+        Returns:
+            bytes: The raw body of the server's response to the request.
+
+        Raises:
+            HTTPError: If the GET request fails with a non-200 status code and not in the expected_statuscodes list.
+        """
+        response = self._request(
+            "GET",
+            path,
+            params=params,
+            timeout=timeout,
+            expected_statuscodes=expected_statuscodes,
+        )
+
+        return response.content
+
+    #######################################
+    def get_stream(
+        self,
+        path: str,
+        params: Dict = None,
+        timeout=15,
+        chunk_size: int = 65536,
+    ) -> ResponseStream:
+        """
+        Sends a GET request to the specified path with optional parameters and streams the response body.
+        Use this for large bodies that should not be held in memory at once; the connection is released
+        once the body is consumed or the stream is closed, e.g. by using it as a context manager.
+        Not retried, as a partially consumed body cannot be replayed.
+
+        Args:
+            path (str): The path to send the GET request to.
+            params (Dict, optional): Optional parameters to include in the request. Defaults to None.
+            timeout (int, optional): The timeout in seconds for connecting and between received chunks. Defaults to 15.
+            chunk_size (int, optional): The size of the chunks to yield, in bytes. Defaults to 64 KiB.
+
+        Returns:
+            ResponseStream: An iterator over the chunks of the server's response body.
+
+        Raises:
+            HTTPError: If the GET request fails with a non-200 status code.
+        """
+        response = self._request(
+            "GET", path, params=params, timeout=timeout, stream=True, attempts=1
+        )
+
+        return ResponseStream(response, chunk_size)
+
+    #######################################
+    def download(
+        self,
+        url: str,
+        file: BinaryIO,
+        timeout=60,
+        chunk_size: int = 1024 * 1024,
+    ) -> None:
+        """
+        Streams the body of an absolute URL, e.g. a signed storage link, into a file. The request is sent without
+        the client's credentials, over the pooled connections of the session, and is not retried.
+
+        Args:
+            url (str): The absolute URL to download.
+            file (BinaryIO): The file to write the body to.
+            timeout (int, optional): The timeout in seconds for connecting and between received chunks. Defaults to 60.
+            chunk_size (int, optional): The size of the chunks to write, in bytes. Defaults to 1 MiB.
+
+        Raises:
+            HTTPError: If the download fails with a non-200 status code.
+        """
+        with self._session.get(url, timeout=timeout, stream=True) as response:
             response.raise_for_status()
 
-        return response.json()
+            for chunk in response.iter_content(chunk_size=chunk_size):
+                file.write(chunk)
 
     #######################################
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_random_exponential(max=5),
-        retry=retry_if_exception_type(Timeout),
-    )
-    @sleep_and_retry
-    @limits(calls=100, period=60)
     def post(
         self,
         path: str,
         body: Dict,
         params: Dict = None,
         timeout=15,
-        expected_statuscodes=[],
+        expected_statuscodes=(),
     ) -> Dict:
         """
         Sends a POST request to the specified path with optional parameters.
@@ -131,34 +636,23 @@ class API:
             body (Dict): The JSON body to include in the request.
             params (Dict, optional): Optional parameters to include in the request. Defaults to None.
             timeout (int, optional): The timeout in seconds for the request. Defaults to 15.
-            expected_statuscodes (List[int], optional): List of expected status codes. Defaults to an empty list.
+            expected_statuscodes (Collection[int], optional): Status codes to accept besides 200. Defaults to none.
 
         Returns:
             Dict: The JSON body of the server's response to the request.
         """
-        response = self._session.post(
-            self._endpoint(path), params=params, json=body, timeout=timeout
+        response = self._request(
+            "POST",
+            path,
+            params=params,
+            body=body,
+            timeout=timeout,
+            expected_statuscodes=expected_statuscodes,
         )
 
-        if (
-            response.status_code != 200
-            and not response.status_code in expected_statuscodes
-        ):
-            logging.error(
-                "POST %s failed with status code %s", path, response.status_code
-            )
-            response.raise_for_status()
-
-        return response.json()
+        return _decode_json(response)
 
     #######################################
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_random_exponential(max=5),
-        retry=retry_if_exception_type(Timeout),
-    )
-    @sleep_and_retry
-    @limits(calls=1000, period=60)
     def delete(self, path: str, timeout=5):
         """
         Sends a DELETE request to the specified path.
@@ -172,13 +666,94 @@ class API:
 
             HTTPError: If the DELETE request fails with a non-200 status code.
         """
-        response = self._session.delete(self._endpoint(path), timeout=timeout)
+        self._request("DELETE", path, timeout=timeout)
 
-        if response.status_code != 200:
-            logging.error(
-                "DELETE %s failed with status code %s", path, response.status_code
-            )
-            response.raise_for_status()
+    #######################################
+    async def run_async(self, fun: Callable, *args, **kwargs):
+        """
+        Runs a blocking call on the worker threads shared by the clients of this session, without blocking
+        the event loop or taking threads from its default executor. Use this to make blocking calls that go
+        through the client, e.g. of its resources, from async code.
+
+        Args:
+
+            fun (Callable): The blocking call.
+            *args: The positional arguments of the call.
+            **kwargs: The keyword arguments of the call.
+
+        Returns:
+
+            The result of the call.
+        """
+        executor = get_executor(
+            self._endpoint_base, self._pool_connections, self._pool_maxsize
+        )
+
+        return await asyncio.get_running_loop().run_in_executor(
+            executor, partial(fun, *args, **kwargs)
+        )
+
+    #######################################
+    async def aget(self, path: str, **kwargs) -> Dict:
+        """
+        Sends a GET request without blocking the event loop; the request is executed on the worker threads of the shared session.
+
+        Args:
+
+            path (str): The path to send the GET request to.
+            **kwargs: Further arguments as accepted by `get`.
+
+        Returns:
+
+            Dict: The JSON body of the server's response to the request.
+        """
+        return await self.run_async(self.get, path, **kwargs)
+
+    #######################################
+    async def aget_content(self, path: str, **kwargs) -> bytes:
+        """
+        Sends a GET request without blocking the event loop and returns the raw response body;
+        the request is executed on the worker threads of the shared session.
+
+        Args:
+
+            path (str): The path to send the GET request to.
+            **kwargs: Further arguments as accepted by `get_content`.
+
+        Returns:
+
+            bytes: The raw body of the server's response to the request.
+        """
+        return await self.run_async(self.get_content, path, **kwargs)
+
+    #######################################
+    async def apost(self, path: str, body: Dict, **kwargs) -> Dict:
+        """
+        Sends a POST request without blocking the event loop; the request is executed on the worker threads of the shared session.
+
+        Args:
+
+            path (str): The path to send the POST request to.
+            body (Dict): The JSON body to include in the request.
+            **kwargs: Further arguments as accepted by `post`.
+
+        Returns:
+
+            Dict: The JSON body of the server's response to the request.
+        """
+        return await self.run_async(self.post, path, body, **kwargs)
+
+    #######################################
+    async def adelete(self, path: str, **kwargs):
+        """
+        Sends a DELETE request without blocking the event loop; the request is executed on the worker threads of the shared session.
+
+        Args:
+
+            path (str): The path to send the DELETE request to.
+            **kwargs: Further arguments as accepted by `delete`.
+        """
+        await self.run_async(self.delete, path, **kwargs)
 
 
 #################################################
@@ -189,7 +764,12 @@ class APIKeyAPI(API):
 
     #######################################
     def __init__(
-        self, endpoint_base: str, api_key: str, api_key_env_var: str = None
+        self,
+        endpoint_base: str,
+        api_key: str,
+        api_key_env_var: str = None,
+        pool_connections: int = None,
+        pool_maxsize: int = None,
     ) -> None:
         """
         Initializes the API client.
@@ -200,12 +780,17 @@ class APIKeyAPI(API):
             api_key (str): The API key to be used for authentication.
             api_key_env_var (str, optional): The name of the environment variable that contains the API key.
                 If not provided, the API key must be passed directly as an argument. Defaults to None.
+            pool_connections (int, optional): The number of connection pools to cache, one per host.
+                Defaults to the DEEPSIGHTS_POOL_CONNECTIONS environment variable, or 10.
+            pool_maxsize (int, optional): The maximum number of connections to keep alive per host; callers beyond
+                open short-lived connections. Defaults to the DEEPSIGHTS_POOL_MAXSIZE environment variable,
+                or four per CPU and at least 100.
 
         Raises:
 
             AssertionError: If neither API key nor environment variable is provided.
         """
-        super().__init__(endpoint_base)
+        super().__init__(endpoint_base, pool_connections, pool_maxsize)
 
         # set api key
         assert (
@@ -215,9 +800,8 @@ class APIKeyAPI(API):
             api_key = os.environ.get(api_key_env_var)
         self._api_key = api_key
 
-        # prepare session
-        self._session = Session()
-        self._session.headers.update({"X-Api-Key": self._api_key})
+        # prepare headers
+        self._headers = {"X-Api-Key": self._api_key}
 
 
 #################################################
@@ -227,7 +811,13 @@ class OAuthTokenAPI(API):
     """
 
     #######################################
-    def __init__(self, endpoint_base: str, oauth_token: str) -> None:
+    def __init__(
+        self,
+        endpoint_base: str,
+        oauth_token: str,
+        pool_connections: int = None,
+        pool_maxsize: int = None,
+    ) -> None:
         """
         Initializes the API client.
 
@@ -235,12 +825,16 @@ class OAuthTokenAPI(API):
 
             endpoint_base (str): The base URL of the API endpoint.
             oauth_token (str): The OAuth token to be used for authentication.
+            pool_connections (int, optional): The number of connection pools to cache, one per host.
+                Defaults to the DEEPSIGHTS_POOL_CONNECTIONS environment variable, or 10.
+            pool_maxsize (int, optional): The maximum number of connections to keep alive per host; callers beyond
+                open short-lived connections. Defaults to the DEEPSIGHTS_POOL_MAXSIZE environment variable,
+                or four per CPU and at least 100.
         """
-        super().__init__(endpoint_base)
+        super().__init__(endpoint_base, pool_connections, pool_maxsize)
 
         # set token
         self._oauth_token = oauth_token
 
-        # prepare session
-        self._session = Session()
-        self._session.headers.update({"Authorization": f"Bearer {self._oauth_token}"})
+        # prepare headers
+        self._headers = {"Authorization": f"Bearer {self._oauth_token}"}
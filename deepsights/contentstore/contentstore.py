@@ -16,8 +16,11 @@
 This module contains the client to interact with the ContentStore API.
 """
 
+import threading
+from cachetools import TTLCache
 from deepsights.api.api import APIKeyAPI
 from deepsights.contentstore.resources import NewsResource, SecondaryResource
+from deepsights.contentstore.resources._semantic import SemanticSearchCache
 
 
 #################################################
@@ -28,15 +31,21 @@ class ContentStore(APIKeyAPI):
 
     news: NewsResource
     secondary: SecondaryResource
+    search_cache: TTLCache
+    semantic_search_cache: SemanticSearchCache
 
     #######################################
-    def __init__(self, api_key: str = None) -> None:
+    def __init__(
+        self, api_key: str = None, semantic_cache_threshold: float = None
+    ) -> None:
         """
         Initializes the API client.
 
         Args:
 
             api_key (str, optional): The API key to be used for authentication. If not provided, it will be fetched from the environment variable CONTENTSTORE_API_KEY.
+            semantic_cache_threshold (float, optional): If given, vector searches whose query embedding has at least this cosine similarity
+                to a recent search with the same filters are answered from a cache, e.g. 0.98. Defaults to None, i.e. disabled.
         """
         super().__init__(
             endpoint_base="https://apigee.mlsdevcloud.com/secondary-content/api/",
@@ -44,5 +53,14 @@ class ContentStore(APIKeyAPI):
             api_key_env_var="CONTENTSTORE_API_KEY",
         )
 
+        # recent search responses, so repeated identical searches skip the round-trip; set to None to disable
+        self.search_cache = TTLCache(maxsize=1024, ttl=300)
+        self.search_cache_lock = threading.Lock()
+        self.semantic_search_cache = (
+            SemanticSearchCache(threshold=semantic_cache_threshold)
+            if semantic_cache_threshold is not None
+            else None
+        )
+
         self.news = NewsResource(self)
         self.secondary = SecondaryResource(self)
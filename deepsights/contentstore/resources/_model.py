@@ -16,9 +16,10 @@
 This module contains the base models for the content store.
 """
 
+import sys
 from typing import Optional, List
 from datetime import datetime
-from pydantic import Field
+from pydantic import AliasChoices, AliasPath, ConfigDict, Field, field_validator
 from deepsights.utils import DeepSightsIdTitleModel, DeepSightsBaseModel
 
 
@@ -34,6 +35,9 @@ class ContentStoreSearchMatch(DeepSightsBaseModel):
         score (float): The score of the match paragraph.
     """
 
+    # matches are never changed after parsing; frozen, they are also hashable
+    model_config = ConfigDict(frozen=True)
+
     type: str = Field(description="The type of the match paragraph.")
     page_number: Optional[int] = Field(
         description="The page number of the match paragraph.", default=None
@@ -75,6 +79,7 @@ class ContentStoreSearchResult(DeepSightsIdTitleModel):
     )
     source: Optional[str] = Field(
         alias="source_name",
+        validation_alias=AliasChoices("source_name", AliasPath("source", "display_name")),
         description="The name of the item's source; may be None.",
         default=None,
     )
@@ -82,5 +87,12 @@ class ContentStoreSearchResult(DeepSightsIdTitleModel):
         default=None, description="The final rank of the item in the search results."
     )
     paragraphs: Optional[List[ContentStoreSearchMatch]] = Field(
-        description="The match paragraphs in the item; may be None.", default=[]
+        description="The match paragraphs in the item; may be None.", default_factory=list
     )
+
+    #############################################
+    @field_validator("source")
+    @classmethod
+    def _intern_source(cls, source: Optional[str]) -> Optional[str]:
+        # sources repeat across hits, so their names are interned to share one string
+        return sys.intern(source) if source else source
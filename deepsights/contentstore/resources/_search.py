@@ -16,15 +16,24 @@
 This module contains the base functions to search the ContentStore.
 """
 
-from typing import List
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
-from pydantic import BaseModel
-from deepsights.api import API
+from pydantic import BaseModel, TypeAdapter
+from deepsights.api import API, APIResource
+from deepsights.api.api import json_dumps
 from deepsights.utils import (
     promote_exact_matches,
     rerank_by_recency,
+    run_in_parallel,
 )
 
+# list validators per result model, built on first use
+_ADAPTERS: Dict[type, TypeAdapter] = {}
+
+# the resource methods running each kind of search in contentstore_multi_search
+_SEARCH_METHODS = {"hybrid": "search", "vector": "vector_search", "text": "text_search"}
+
 
 #################################################
 def _get_time_filter(search_from_timestamp: datetime, search_to_timestamp: datetime):
@@ -39,15 +48,123 @@ def _get_time_filter(search_from_timestamp: datetime, search_to_timestamp: datet
         dict: A time filter dictionary with "from" and "to" keys representing the search range.
               The values are ISO-formatted timestamps or None if the corresponding input is None.
     """
-    time_filter = None
-    if search_from_timestamp or search_to_timestamp:
-        time_filter = {
-            "from": (
-                search_from_timestamp.isoformat() if search_from_timestamp else None
-            ),
-            "to": search_to_timestamp.isoformat() if search_to_timestamp else None,
-        }
-    return time_filter
+    if not (search_from_timestamp or search_to_timestamp):
+        return None
+
+    # build a new dict each time, so callers never share one
+    time_from, time_to = _format_time_range(search_from_timestamp, search_to_timestamp)
+    return {"from": time_from, "to": time_to}
+
+
+#################################################
+@lru_cache(maxsize=512)
+def _format_time_range(
+    search_from_timestamp: datetime, search_to_timestamp: datetime
+) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Formats a search time range as ISO timestamps; cached, as paginated searches repeat the same range.
+
+    Args:
+        search_from_timestamp (datetime): The starting timestamp for the search, or None.
+        search_to_timestamp (datetime): The ending timestamp for the search, or None.
+
+    Returns:
+        Tuple[Optional[str], Optional[str]]: The ISO-formatted timestamps, or None for each missing one.
+    """
+    return (
+        search_from_timestamp.isoformat() if search_from_timestamp else None,
+        search_to_timestamp.isoformat() if search_to_timestamp else None,
+    )
+
+
+#################################################
+def _post_search(api: API, path: str, body: Dict, use_cache: bool) -> List[Dict]:
+    """
+    Sends a search request and returns the raw items of the response. If the client has a search cache,
+    the items of identical requests are taken from it; they are parsed anew by each caller.
+
+    Args:
+        api (API): The DeepSights API instance; its `search_cache`, if any, holds recent responses.
+        path (str): The path of the search endpoint.
+        body (Dict): The body of the search request.
+        use_cache (bool): Whether to use the search cache.
+
+    Returns:
+        List[Dict]: The raw items of the search response.
+    """
+    cache = getattr(api, "search_cache", None) if use_cache else None
+    if cache is None:
+        return api.post(path, body=body)["items"]
+
+    key = (path, json_dumps(body))
+    with api.search_cache_lock:
+        items = cache.get(key)
+
+    if items is None:
+        items = api.post(path, body=body)["items"]
+        with api.search_cache_lock:
+            cache[key] = items
+
+    return items
+
+
+#################################################
+def _parse_results(search_result: BaseModel, items: List[Dict]) -> List[BaseModel]:
+    """
+    Parses the raw items of a search response into search results.
+
+    Args:
+        search_result (BaseModel): The model to use for parsing search results; may also be a function parsing one item.
+        items (List[Dict]): The raw items of the search response.
+
+    Returns:
+        List[BaseModel]: The search results.
+    """
+    if not (isinstance(search_result, type) and issubclass(search_result, BaseModel)):
+        return list(map(search_result, items))
+
+    # validate the whole list in one call to pydantic-core
+    adapter = _ADAPTERS.get(search_result)
+    if adapter is None:
+        adapter = _ADAPTERS.setdefault(search_result, TypeAdapter(List[search_result]))
+
+    return adapter.validate_python(items)
+
+
+#################################################
+def _validate_search_args(
+    max_results: int,
+    max_results_limit: int,
+    recency_weight: float,
+    min_score: float = None,
+):
+    """
+    Checks the arguments shared by the search functions, testing them all in one condition and
+    only working out the offending one if it fails.
+
+    Args:
+
+        max_results (int): The maximum number of search results to return.
+        max_results_limit (int): The largest allowed value of max_results.
+        recency_weight (float): The weight to apply to recency in result ranking, or None.
+        min_score (float, optional): The minimum score threshold for search results, if the search has one. Defaults to None.
+
+    Raises:
+
+        ValueError: If an argument is out of range.
+    """
+    if (
+        0 < max_results <= max_results_limit
+        and (recency_weight is None or 0 <= recency_weight <= 1)
+        and (min_score is None or 0 <= min_score <= 1)
+    ):
+        return
+
+    if not 0 < max_results <= max_results_limit:
+        raise ValueError(f"Maximum results must be between 1 and {max_results_limit}.")
+    if min_score is not None and not 0 <= min_score <= 1:
+        raise ValueError("Minimum score must be between 0 and 1.")
+    raise ValueError("Recency weight must be between 0 and 1.")
 
 
 #################################################
@@ -66,6 +183,7 @@ def contentstore_hybrid_search(
     search_from_timestamp: datetime = None,
     search_to_timestamp: datetime = None,
     search_only_ai_allowed_content: bool = True,
+    use_cache: bool = True,
 ):
     """
     Perform a contentstore hybrid search using the provided query.
@@ -86,24 +204,25 @@ def contentstore_hybrid_search(
         search_from_timestamp (datetime, optional): The start timestamp for the search. Defaults to None.
         search_to_timestamp (datetime, optional): The end timestamp for the search. Defaults to None.
         search_only_ai_allowed_content (bool, optional): Whether to search only AI-allowed content. Defaults to True.
+        use_cache (bool, optional): Whether to answer repeated identical searches from the client's search cache. Defaults to True.
 
     Returns:
 
         List[BaseModel]: The re-ranked search results.
+
+    Raises:
+
+        ValueError: If an argument is missing or out of range.
     """
-    assert query, "The 'query' argument is required."
-    assert 0 <= min_vector_score <= 1, "Minimum vector score must be between 0 and 1."
-    assert 0 <= vector_fraction <= 1, "Vector fraction must be between 0 and 1"
-    assert 0 <= vector_weight <= 1, "Vector weught must be between 0 and 1"
-    assert 0 < max_results <= 250, "Maximum results must be between 1 and 250."
-    assert (
-        recency_weight is None or 0 <= recency_weight <= 1
-    ), "Recency weight must be between 0 and 1."
+    if not query:
+        raise ValueError("The 'query' argument is required.")
+    if not (0 <= vector_fraction <= 1 and 0 <= vector_weight <= 1):
+        raise ValueError("Vector fraction and vector weight must be between 0 and 1.")
+    _validate_search_args(max_results, 250, recency_weight, min_vector_score)
 
     body = {
         "query": query,
         "source_items_type": item_type,
-        "content_restrictions": "NONE",
         "limit": max_results,
         "vector_search_cut_off_score": min_vector_score,
         "alfa": vector_weight,
@@ -116,18 +235,18 @@ def contentstore_hybrid_search(
             "ALLOWED_FOR_AI_SUMMARIZATION" if search_only_ai_allowed_content else "NONE"
         ),
     }
-    response = api.post("item-service/items/_hybrid-search", body=body)
+    items = _post_search(api, "item-service/items/_hybrid-search", body, use_cache)
 
     # parse
-    results = [search_result(i) for i in response["items"]]
+    results = _parse_results(search_result, items)
 
     # pull exact matches to the top
     if promote_exact_match:
         results = promote_exact_matches(query, results)
 
     # record rank
-    for rank, result in enumerate(results):
-        result.rank = rank + 1
+    for rank, result in enumerate(results, 1):
+        result.rank = rank
 
     return results
 
@@ -145,6 +264,7 @@ def contentstore_vector_search(
     search_from_timestamp: datetime = None,
     search_to_timestamp: datetime = None,
     search_only_ai_allowed_content: bool = True,
+    use_cache: bool = True,
 ):
     """
     Perform a contentstore vector search using the provided query embedding.
@@ -152,7 +272,7 @@ def contentstore_vector_search(
     Args:
 
         api (API): The DeepSights API instance.
-        query_embedding (List): The query embedding vector.
+        query_embedding (List): The query embedding vector; may also be a 1-D numpy array or an `array.array`.
         item_type (str): The type of items to search for.
         search_result (BaseModel): The model to use for parsing search results.
         min_score (float, optional): The minimum score threshold for search results. Defaults to 0.7.
@@ -162,23 +282,25 @@ def contentstore_vector_search(
         search_from_timestamp (datetime, optional): The start timestamp for the search. Defaults to None.
         search_to_timestamp (datetime, optional): The end timestamp for the search. Defaults to None.
         search_only_ai_allowed_content (bool, optional): Whether to search only AI-allowed content. Defaults to True.
+        use_cache (bool, optional): Whether to answer repeated identical searches from the client's search cache. Defaults to True.
 
     Returns:
 
         List[BaseModel]: The re-ranked search results.
+
+    Raises:
+
+        ValueError: If an argument is missing or out of range.
     """
-    assert query_embedding, "The 'query_embedding' argument is required."
-    assert len(query_embedding) == 1536, "The 'query_embedding' must be of length 1536."
-    assert 0 <= min_score <= 1, "Minimum score must be between 0 and 1."
-    assert 0 < max_results <= 100, "Maximum results must be between 1 and 100."
-    assert (
-        recency_weight is None or 0 <= recency_weight <= 1
-    ), "Recency weight must be between 0 and 1."
+    if query_embedding is None:
+        raise ValueError("The 'query_embedding' argument is required.")
+    if getattr(query_embedding, "ndim", 1) != 1 or len(query_embedding) != 1536:
+        raise ValueError("The 'query_embedding' must be of length 1536.")
+    _validate_search_args(max_results, 100, recency_weight, min_score)
 
     body = {
         "vector": query_embedding,
         "source_items_type": item_type,
-        "content_restrictions": "NONE",
         "limit": max_results,
         "score_lower_bound": min_score,
         "sort": "RELEVANCY_DESC",
@@ -188,10 +310,19 @@ def contentstore_vector_search(
             "ALLOWED_FOR_AI_SUMMARIZATION" if search_only_ai_allowed_content else "NONE"
         ),
     }
-    response = api.post("item-service/items/_vector-search", body=body)
+    # near-identical embeddings with the same filters are answered from the semantic cache, if enabled
+    semantic_cache = getattr(api, "semantic_search_cache", None) if use_cache else None
+    if semantic_cache is None:
+        items = _post_search(api, "item-service/items/_vector-search", body, use_cache)
+    else:
+        key = json_dumps({k: v for k, v in body.items() if k != "vector"})
+        items = semantic_cache.get(key, query_embedding)
+        if items is None:
+            items = _post_search(api, "item-service/items/_vector-search", body, use_cache)
+            semantic_cache.put(key, query_embedding, items)
 
     # parse
-    results = [search_result(i) for i in response["items"]]
+    results = _parse_results(search_result, items)
 
     # re-rank
     return rerank_by_recency(results, recency_weight=recency_weight)
@@ -210,6 +341,7 @@ def contentstore_text_search(
     search_from_timestamp: datetime = None,
     search_to_timestamp: datetime = None,
     search_only_ai_allowed_content: bool = True,
+    use_cache: bool = True,
 ):
     """
     Perform a contentstore text search using the specified query and item type. If the query is None, the search will be sorted by publication date.
@@ -227,15 +359,17 @@ def contentstore_text_search(
         search_from_timestamp (datetime, optional): The start timestamp for the search. Defaults to None.
         search_to_timestamp (datetime, optional): The end timestamp for the search. Defaults to None.
         search_only_ai_allowed_content (bool, optional): Whether to search only AI-allowed content. Defaults to True.
+        use_cache (bool, optional): Whether to answer repeated identical searches from the client's search cache. Defaults to True.
 
     Returns:
 
         List[BaseModel]: The re-ranked search results.
+
+    Raises:
+
+        ValueError: If an argument is missing or out of range.
     """
-    assert 0 < max_results <= 100, "Maximum results must be between 1 and 100."
-    assert (
-        recency_weight is None or 0 <= recency_weight <= 1
-    ), "Recency weight must be between 0 and 1."
+    _validate_search_args(max_results, 100, recency_weight)
 
     # force proper empty search
     if query is not None and len(query.strip()) == 0:
@@ -244,7 +378,6 @@ def contentstore_text_search(
     body = {
         "query": query,
         "source_items_type": item_type,
-        "content_restrictions": "NONE",
         "limit": max_results,
         "offset": offset,
         "sort": "RELEVANCY_DESC" if query is not None else "PUBLISHED_AT_DESC",
@@ -254,10 +387,44 @@ def contentstore_text_search(
             "ALLOWED_FOR_AI_SUMMARIZATION" if search_only_ai_allowed_content else "NONE"
         ),
     }
-    response = api.post("item-service/items/_text-search", body=body)
+    items = _post_search(api, "item-service/items/_text-search", body, use_cache)
 
     # parse
-    results = [search_result(i) for i in response["items"]]
+    results = _parse_results(search_result, items)
 
     # re-rank
     return rerank_by_recency(results, recency_weight=recency_weight)
+
+
+#################################################
+def contentstore_multi_search(resource: APIResource, searches: List[Dict]) -> List[List]:
+    """
+    Runs several searches of a content store resource concurrently, so they take as long as the slowest one
+    instead of the sum of all.
+
+    Args:
+
+        resource (APIResource): The content store resource to search, e.g. news.
+        searches (List[Dict]): The searches, each as a dict with the "kind" of search ("hybrid", "vector" or "text")
+            and the "kwargs" of the corresponding resource method.
+
+    Returns:
+
+        List[List]: The search results of each search, in the order of the searches.
+
+    Raises:
+
+        ValueError: If a search lacks a valid "kind", or an argument of a search is missing or out of range.
+    """
+    if not all(search.get("kind") in _SEARCH_METHODS for search in searches):
+        raise ValueError(
+            f"The 'kind' of each search must be one of {', '.join(_SEARCH_METHODS)}."
+        )
+
+    return run_in_parallel(
+        lambda search: getattr(resource, _SEARCH_METHODS[search["kind"]])(
+            **search.get("kwargs", {})
+        ),
+        searches,
+        max_workers=max(1, len(searches)),
+    )
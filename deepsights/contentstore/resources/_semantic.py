@@ -0,0 +1,153 @@
+# Copyright 2024 Market Logic Software AG. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+This module contains the semantic cache of the ContentStore vector search.
+"""
+
+import math
+import time
+import operator
+import threading
+from collections import deque
+from collections.abc import Hashable
+from typing import Deque, Dict, List, Optional, Sequence, Tuple
+
+# math.sumprod (Python 3.12+) computes dot products in C, several times faster than a map/sum loop
+try:
+    from math import sumprod as _dot
+
+except ImportError:
+
+    def _dot(a: Sequence[float], b: Sequence[float]) -> float:
+        return sum(map(operator.mul, a, b))
+
+
+#################################################
+def _normalize(embedding: Sequence[float]) -> Tuple[float, ...]:
+    """
+    Scales an embedding to unit length, so that cosine similarities become dot products.
+
+    Args:
+
+        embedding (Sequence[float]): The embedding; may also be an array with a `tolist` method.
+
+    Returns:
+
+        Tuple[float, ...]: The unit-length embedding.
+    """
+    if hasattr(embedding, "tolist"):
+        embedding = embedding.tolist()
+
+    norm = math.sqrt(_dot(embedding, embedding)) or 1.0
+    return tuple(x / norm for x in embedding)
+
+
+#################################################
+class SemanticSearchCache:
+    """
+    Represents a cache of recent vector search responses that also answers searches whose query embedding is
+    nearly identical to a cached one, e.g. for slightly reworded questions. Lookups compare the query against
+    every cached embedding with the same key, so the cache is kept small.
+    """
+
+    #######################################
+    def __init__(
+        self, threshold: float = 0.98, max_size: int = 64, ttl: float = 300
+    ) -> None:
+        """
+        Initializes the cache.
+
+        Args:
+
+            threshold (float, optional): The minimum cosine similarity of a cached embedding to answer a search.
+                Defaults to 0.98.
+            max_size (int, optional): The maximum number of cached responses; the oldest are dropped first.
+                Defaults to 64.
+            ttl (float, optional): The time to keep a response, in seconds. Defaults to 300.
+
+        Raises:
+
+            ValueError: If the threshold is not between 0 and 1.
+        """
+        if not 0 < threshold <= 1:
+            raise ValueError("Threshold must be between 0 and 1.")
+
+        self.threshold = threshold
+        self.ttl = ttl
+        self._entries: Deque[Tuple[Hashable, Tuple[float, ...], List[Dict], float]] = (
+            deque(maxlen=max_size)
+        )
+        self._lock = threading.Lock()
+
+    #######################################
+    def get(self, key: Hashable, embedding: Sequence[float]) -> Optional[List[Dict]]:
+        """
+        Returns the cached response items of the most similar search with the same key, if similar enough.
+
+        Args:
+
+            key (Hashable): The key of the search besides its embedding, i.e. its endpoint and filters.
+            embedding (Sequence[float]): The query embedding.
+
+        Returns:
+
+            Optional[List[Dict]]: The cached response items, or None.
+        """
+        now = time.monotonic()
+
+        with self._lock:
+            candidates = [
+                (entry_embedding, items)
+                for entry_key, entry_embedding, items, expiry in self._entries
+                if expiry > now and entry_key == key
+            ]
+
+        # searches with other filters are common, so the query is only normalized if there is something to compare
+        if not candidates:
+            return None
+
+        query = _normalize(embedding)
+
+        best_items, best_score = None, self.threshold
+        for entry_embedding, items in candidates:
+            score = _dot(query, entry_embedding)
+            if score >= best_score:
+                best_items, best_score = items, score
+
+        return best_items
+
+    #######################################
+    def put(self, key: Hashable, embedding: Sequence[float], items: List[Dict]) -> None:
+        """
+        Caches the response items of a search.
+
+        Args:
+
+            key (Hashable): The key of the search besides its embedding, i.e. its endpoint and filters.
+            embedding (Sequence[float]): The query embedding.
+            items (List[Dict]): The response items.
+        """
+        entry = (key, _normalize(embedding), items, time.monotonic() + self.ttl)
+
+        with self._lock:
+            self._entries.append(entry)
+
+    #######################################
+    def clear(self) -> None:
+        """
+        Empties the cache.
+        """
+        with self._lock:
+            self._entries.clear()
@@ -16,7 +16,7 @@
 This module defines the resource to retrieve news content from the DeepSights API.
 """
 
-from typing import List
+from typing import Dict, List
 from datetime import datetime
 
 from deepsights.api import APIResource
@@ -25,6 +25,7 @@ from deepsights.contentstore.resources._search import (
     contentstore_text_search,
     contentstore_vector_search,
     contentstore_hybrid_search,
+    contentstore_multi_search,
 )
 
 
@@ -52,19 +53,22 @@ class NewsResource(APIResource):
         recency_weight: float = None,
         search_from_timestamp: datetime = None,
         search_to_timestamp: datetime = None,
+        use_cache: bool = True,
     ):
         """
         Perform a vector-based search for news articles.
 
         Args:
 
-            query_embedding (List): The embedding vector representing the query.
+            query_embedding (List): The embedding vector representing the query; may also be a 1-D numpy array.
             min_score (float, optional): The minimum score threshold for search results. Defaults to 0.7.
             max_results (int, optional): The maximum number of search results to return. Defaults to 30.
             languages (List[str], optional): The list of languages to search for. Defaults to None.
             recency_weight (float, optional): The weight to apply to recency in the search ranking. Defaults to None.
             search_from_timestamp (datetime, optional): The start timestamp for the search. Defaults to None.
             search_to_timestamp (datetime, optional): The end timestamp for the search. Defaults to None.
+            use_cache (bool, optional): Whether to answer a repeated identical search from the client's search cache,
+                i.e. with results up to 5 minutes old. Defaults to True.
 
         Returns:
 
@@ -74,9 +78,7 @@ class NewsResource(APIResource):
         return contentstore_vector_search(
             self.api,
             item_type="NEWS",
-            search_result=lambda i: NewsSearchResult(
-                **dict(source_name=i["source"]["display_name"], **i)
-            ),
+            search_result=NewsSearchResult,
             query_embedding=query_embedding,
             min_score=min_score,
             max_results=max_results,
@@ -84,6 +86,7 @@ class NewsResource(APIResource):
             languages=languages,
             search_from_timestamp=search_from_timestamp,
             search_to_timestamp=search_to_timestamp,
+            use_cache=use_cache,
         )
 
     #################################################
@@ -96,6 +99,7 @@ class NewsResource(APIResource):
         recency_weight: float = None,
         search_from_timestamp: datetime = None,
         search_to_timestamp: datetime = None,
+        use_cache: bool = True,
     ):
         """
         Perform a text search for news articles in the DeepSights content store.
@@ -109,6 +113,8 @@ class NewsResource(APIResource):
             recency_weight (float, optional): The weight to assign to recency in the search ranking. Defaults to None.
             search_from_timestamp (datetime, optional): The start timestamp for the search. Defaults to None.
             search_to_timestamp (datetime, optional): The end timestamp for the search. Defaults to None.
+            use_cache (bool, optional): Whether to answer a repeated identical search from the client's search cache,
+                i.e. with results up to 5 minutes old. Defaults to True.
 
         Returns:
 
@@ -117,9 +123,7 @@ class NewsResource(APIResource):
         return contentstore_text_search(
             self.api,
             item_type="NEWS",
-            search_result=lambda i: NewsSearchResult(
-                **dict(source_name=i["source"]["display_name"], **i)
-            ),
+            search_result=NewsSearchResult,
             query=query,
             max_results=max_results,
             recency_weight=recency_weight,
@@ -127,6 +131,7 @@ class NewsResource(APIResource):
             offset=offset,
             search_from_timestamp=search_from_timestamp,
             search_to_timestamp=search_to_timestamp,
+            use_cache=use_cache,
         )
 
     #################################################
@@ -142,6 +147,7 @@ class NewsResource(APIResource):
         promote_exact_match: bool = False,
         search_from_timestamp: datetime = None,
         search_to_timestamp: datetime = None,
+        use_cache: bool = True,
     ):
         """
         Perform a contentstore hybrid search using the provided query.
@@ -159,6 +165,8 @@ class NewsResource(APIResource):
             promote_exact_match (bool, optional): Whether to promote exact matches in the search ranking. Defaults to False.
             search_from_timestamp (datetime, optional): The start timestamp for the search. Defaults to None.
             search_to_timestamp (datetime, optional): The end timestamp for the search. Defaults to None.
+            use_cache (bool, optional): Whether to answer a repeated identical search from the client's search cache,
+                i.e. with results up to 5 minutes old. Defaults to True.
 
         Returns:
 
@@ -167,9 +175,7 @@ class NewsResource(APIResource):
         return contentstore_hybrid_search(
             self.api,
             item_type="NEWS",
-            search_result=lambda i: NewsSearchResult(
-                **dict(source_name=i["source"]["display_name"], **i)
-            ),
+            search_result=NewsSearchResult,
             query=query,
             max_results=max_results,
             vector_weight=vector_weight,
@@ -179,5 +185,22 @@ class NewsResource(APIResource):
             promote_exact_match=promote_exact_match,
             search_from_timestamp=search_from_timestamp,
             search_to_timestamp=search_to_timestamp,
+            use_cache=use_cache,
             languages=languages,
         )
+
+    #################################################
+    def multi_search(self, searches: List[Dict]) -> List[List[NewsSearchResult]]:
+        """
+        Run several searches for news articles concurrently, e.g. a text and a vector search for the same question.
+
+        Args:
+
+            searches (List[Dict]): The searches, each as a dict with the "kind" of search ("hybrid", "vector" or "text")
+                and the "kwargs" of `search`, `vector_search` or `text_search`, respectively.
+
+        Returns:
+
+            List[List[NewsSearchResult]]: The search results of each search, in the order of the searches.
+        """
+        return contentstore_multi_search(self, searches)
@@ -16,7 +16,7 @@
 This module contains the resource to retrieve secondary reports from the DeepSights content store.
 """
 
-from typing import List
+from typing import Dict, List
 from datetime import datetime
 
 from deepsights.api import APIResource
@@ -25,6 +25,7 @@ from deepsights.contentstore.resources._search import (
     contentstore_text_search,
     contentstore_vector_search,
     contentstore_hybrid_search,
+    contentstore_multi_search,
 )
 
 
@@ -51,19 +52,22 @@ class SecondaryResource(APIResource):
         recency_weight: float = None,
         search_from_timestamp: datetime = None,
         search_to_timestamp: datetime = None,
+        use_cache: bool = True,
     ):
         """
         Perform a vector-based search for secondary reports.
 
         Args:
 
-            query_embedding (List): The embedding vector representing the query.
+            query_embedding (List): The embedding vector representing the query; may also be a 1-D numpy array.
             min_score (float, optional): The minimum score threshold for search results. Defaults to 0.7.
             max_results (int, optional): The maximum number of search results to return. Defaults to 50.
             languages (List[str], optional): The languages to search for. Defaults to None.
             recency_weight (float, optional): The weight to apply to recency in the search ranking. Defaults to None.
             search_from_timestamp (datetime, optional): The start timestamp for the search. Defaults to None.
             search_to_timestamp (datetime, optional): The end timestamp for the search. Defaults to None.
+            use_cache (bool, optional): Whether to answer a repeated identical search from the client's search cache,
+                i.e. with results up to 5 minutes old. Defaults to True.
 
         Returns:
 
@@ -73,9 +77,7 @@ class SecondaryResource(APIResource):
         return contentstore_vector_search(
             self.api,
             item_type="REPORTS",
-            search_result=lambda i: SecondarySearchResult(
-                **dict(source_name=i["source"]["display_name"], **i)
-            ),
+            search_result=SecondarySearchResult,
             query_embedding=query_embedding,
             min_score=min_score,
             max_results=max_results,
@@ -83,6 +85,7 @@ class SecondaryResource(APIResource):
             languages=languages,
             search_from_timestamp=search_from_timestamp,
             search_to_timestamp=search_to_timestamp,
+            use_cache=use_cache,
         )
 
     #################################################
@@ -95,6 +98,7 @@ class SecondaryResource(APIResource):
         recency_weight: float = None,
         search_from_timestamp: datetime = None,
         search_to_timestamp: datetime = None,
+        use_cache: bool = True,
     ):
         """
         Perform a text search for secondary reports in the DeepSights content store.
@@ -108,6 +112,8 @@ class SecondaryResource(APIResource):
             recency_weight (float, optional): The weight to assign to recency in the search ranking. Defaults to None.
             search_from_timestamp (datetime, optional): The start timestamp for the search. Defaults to None.
             search_to_timestamp (datetime, optional): The end timestamp for the search. Defaults to None.
+            use_cache (bool, optional): Whether to answer a repeated identical search from the client's search cache,
+                i.e. with results up to 5 minutes old. Defaults to True.
 
         Returns:
 
@@ -116,9 +122,7 @@ class SecondaryResource(APIResource):
         return contentstore_text_search(
             self.api,
             item_type="REPORTS",
-            search_result=lambda i: SecondarySearchResult(
-                **dict(source_name=i["source"]["display_name"], **i)
-            ),
+            search_result=SecondarySearchResult,
             query=query,
             max_results=max_results,
             offset=offset,
@@ -126,6 +130,7 @@ class SecondaryResource(APIResource):
             recency_weight=recency_weight,
             search_from_timestamp=search_from_timestamp,
             search_to_timestamp=search_to_timestamp,
+            use_cache=use_cache,
         )
 
     #################################################
@@ -141,6 +146,7 @@ class SecondaryResource(APIResource):
         promote_exact_match: bool = False,
         search_from_timestamp: datetime = None,
         search_to_timestamp: datetime = None,
+        use_cache: bool = True,
     ):
         """
         Perform a contentstore hybrid search using the provided query.
@@ -158,6 +164,8 @@ class SecondaryResource(APIResource):
             promote_exact_match (bool, optional): Whether to promote exact matches in the search ranking. Defaults to False.
             search_from_timestamp (datetime, optional): The start timestamp for the search. Defaults to None.
             search_to_timestamp (datetime, optional): The end timestamp for the search. Defaults to None.
+            use_cache (bool, optional): Whether to answer a repeated identical search from the client's search cache,
+                i.e. with results up to 5 minutes old. Defaults to True.
 
         Returns:
 
@@ -166,9 +174,7 @@ class SecondaryResource(APIResource):
         return contentstore_hybrid_search(
             self.api,
             item_type="REPORTS",
-            search_result=lambda i: SecondarySearchResult(
-                **dict(source_name=i["source"]["display_name"], **i)
-            ),
+            search_result=SecondarySearchResult,
             query=query,
             max_results=max_results,
             vector_weight=vector_weight,
@@ -178,5 +184,22 @@ class SecondaryResource(APIResource):
             promote_exact_match=promote_exact_match,
             search_from_timestamp=search_from_timestamp,
             search_to_timestamp=search_to_timestamp,
+            use_cache=use_cache,
             languages=languages,
         )
+
+    #################################################
+    def multi_search(self, searches: List[Dict]) -> List[List[SecondarySearchResult]]:
+        """
+        Run several searches for secondary reports concurrently, e.g. a text and a vector search for the same question.
+
+        Args:
+
+            searches (List[Dict]): The searches, each as a dict with the "kind" of search ("hybrid", "vector" or "text")
+                and the "kwargs" of `search`, `vector_search` or `text_search`, respectively.
+
+        Returns:
+
+            List[List[SecondarySearchResult]]: The search results of each search, in the order of the searches.
+        """
+        return contentstore_multi_search(self, searches)
@@ -16,7 +16,11 @@
 This module contains the DeepSights client.
 """
 
-from cachetools import TTLCache
+import time
+import threading
+from concurrent.futures import Future
+from typing import Dict
+from cachetools import TLRUCache
 from deepsights.api.api import APIKeyAPI
 from deepsights.documentstore import DocumentStore
 from deepsights.contentstore import ContentStore
@@ -25,6 +29,37 @@ from deepsights.deepsights._mip_identity import MIPIdentityResolver
 from deepsights.deepsights.resources.quota import QuotaResource
 
 
+#################################################
+# user clients are kept for at most this many seconds, and are dropped this many seconds before their token expires
+_USERCLIENT_TTL = 240
+_USERCLIENT_EXPIRY_MARGIN = 30
+
+
+#################################################
+def _userclient_ttu(_key: str, userclient: UserClient, now: float) -> float:
+    """
+    Computes until when a user client may be taken from the cache: for the default time,
+    but no longer than shortly before its token expires.
+
+    Args:
+
+        _key (str): The email of the impersonated user; unused.
+        userclient (UserClient): The user client.
+        now (float): The current time of the cache's timer.
+
+    Returns:
+
+        float: The time of the cache's timer after which the user client is dropped.
+    """
+    ttl = _USERCLIENT_TTL
+
+    expires_at = userclient.token_expiry
+    if expires_at is not None:
+        ttl = min(ttl, expires_at - time.time() - _USERCLIENT_EXPIRY_MARGIN)
+
+    return now + ttl
+
+
 #################################################
 class DeepSights(APIKeyAPI):
     """
@@ -61,18 +96,21 @@ class DeepSights(APIKeyAPI):
             self.contentstore = ContentStore(cs_api_key)
             self._mip_identity_resolver = MIPIdentityResolver(mip_api_key)
 
-            self.userclients = TTLCache(maxsize=100, ttl=240)
+            self.userclients = TLRUCache(maxsize=100, ttu=_userclient_ttu)
+            self._userclients_lock = threading.Lock()
+            self._pending_userclients: Dict[str, Future] = {}
 
     #######################################
     def get_userclient(self, user_email: str) -> UserClient:
         """
-        Retrieves a user client for the given user.
+        Retrieves a user client for the given user. Concurrent calls for the same user share one token request.
 
         Args:
             user_email (str): The email of the user to impersonate.
 
         Returns:
-            UserClient: The user client for the given user. Will be cached.
+            UserClient: The user client for the given user. Will be cached for up to four minutes,
+                but not beyond 30 seconds before its token expires, so cached clients are not handed out with stale tokens.
 
         Raises:
             ValueError: If the user is not found.
@@ -81,12 +119,36 @@ class DeepSights(APIKeyAPI):
         # normalize the email
         user_email = user_email.lower().strip()
 
-        # create the user client if it doesn't exist
-        if user_email not in self.userclients:
+        # return the cached user client, or join a request for it that is already in flight
+        with self._userclients_lock:
+            userclient = self.userclients.get(user_email)
+            if userclient is not None:
+                return userclient
+
+            future = self._pending_userclients.get(user_email)
+            joined = future is not None
+            if not joined:
+                future = self._pending_userclients[user_email] = Future()
+
+        if joined:
+            return future.result()
+
+        # create the user client outside the lock, so calls for other users are not held up
+        try:
             oauth_token = self._mip_identity_resolver.get_oauth_token(user_email)
             if not oauth_token:
                 raise ValueError(f"User not found: {user_email}")
 
-            self.userclients[user_email] = UserClient(oauth_token)
+            userclient = UserClient(oauth_token)
+        except BaseException as e:
+            with self._userclients_lock:
+                del self._pending_userclients[user_email]
+            future.set_exception(e)
+            raise
+
+        with self._userclients_lock:
+            self.userclients[user_email] = userclient
+            del self._pending_userclients[user_email]
+        future.set_result(userclient)
 
-        return self.userclients[user_email]
+        return userclient
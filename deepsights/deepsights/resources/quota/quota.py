@@ -16,10 +16,35 @@
 This module contains the resource to retrieve quota information from the DeepSights API.
 """
 
-from deepsights.api import APIResource
+import time
+from typing import Optional, Tuple
+from deepsights.api import API, APIResource
 from deepsights.deepsights.resources.quota._model import APIProfile, QuotaStatus
 
 
+#################################################
+# the API profile only changes when the API key is reconfigured, so it is kept for this many seconds
+_PROFILE_TTL = 300
+
+_STATUS_PATH = "/static-resolver/quota"
+
+
+#################################################
+def _parse_status(response: bytes) -> QuotaStatus:
+    """
+    Parses the quota status.
+
+    Args:
+
+        response (bytes): The raw quota status response.
+
+    Returns:
+
+        QuotaStatus: The validated quota status.
+    """
+    return QuotaStatus.model_validate_json(response)
+
+
 #################################################
 class QuotaResource(APIResource):
     """
@@ -27,20 +52,81 @@ class QuotaResource(APIResource):
     """
 
     #################################################
-    def get_profile(self) -> APIProfile:
+    def __init__(self, api: API) -> None:
         """
-        Retrieves the API profile from the DeepSights API.
+        Initializes the quota resource.
 
         Args:
 
-            api (ds.DeepSights): The DeepSights API instance.
+            api (API): The API client to use.
+        """
+        super().__init__(api)
+        self._profile_cache: Optional[Tuple[APIProfile, float]] = None
+
+    #################################################
+    def _cached_profile(self) -> Optional[APIProfile]:
+        """
+        Returns the cached API profile if it is still fresh.
+
+        Returns:
+
+            Optional[APIProfile]: The cached API profile, or None.
+        """
+        cached = self._profile_cache
+        if cached is not None and time.monotonic() - cached[1] < _PROFILE_TTL:
+            return cached[0]
+
+        return None
+
+    #################################################
+    def _cache_profile(self, response: bytes) -> APIProfile:
+        """
+        Parses the API profile and caches it.
+
+        Args:
+
+            response (bytes): The raw API profile response.
 
         Returns:
 
             APIProfile: The parsed API profile.
         """
-        response = self.api.get("/static-resolver/api-key-attributes")
-        return APIProfile.model_validate(response)
+        profile = APIProfile.model_validate_json(response)
+        self._profile_cache = (profile, time.monotonic())
+        return profile
+
+    #################################################
+    def get_profile(self) -> APIProfile:
+        """
+        Retrieves the API profile from the DeepSights API; the profile is cached for five minutes.
+
+        Returns:
+
+            APIProfile: The parsed API profile.
+        """
+        profile = self._cached_profile()
+        if profile is not None:
+            return profile
+
+        response = self.api.get_content("/static-resolver/api-key-attributes")
+        return self._cache_profile(response)
+
+    #################################################
+    async def get_profile_async(self) -> APIProfile:
+        """
+        Retrieves the API profile from the DeepSights API without blocking the event loop; the profile is cached
+        for five minutes. Use with `asyncio.gather`, e.g. together with `get_status_async`.
+
+        Returns:
+
+            APIProfile: The parsed API profile.
+        """
+        profile = self._cached_profile()
+        if profile is not None:
+            return profile
+
+        response = await self.api.aget_content("/static-resolver/api-key-attributes")
+        return self._cache_profile(response)
 
     #################################################
     def get_status(self) -> QuotaStatus:
@@ -55,5 +141,35 @@ class QuotaResource(APIResource):
 
             QuotaStatus: The validated quota status response.
         """
-        response = self.api.get("/static-resolver/quota")
-        return QuotaStatus.model_validate(response)
+        return _parse_status(self.api.get_content(_STATUS_PATH))
+
+    #################################################
+    async def get_status_async(self) -> QuotaStatus:
+        """
+        Get the quota status from the DeepSights API without blocking the event loop.
+        Use with `asyncio.gather`, e.g. together with `get_profile_async`.
+
+        Returns:
+
+            QuotaStatus: The validated quota status response.
+        """
+        return _parse_status(await self.api.aget_content(_STATUS_PATH))
+
+    #################################################
+    def get_profile_and_status(self) -> Tuple[APIProfile, QuotaStatus]:
+        """
+        Retrieves the API profile and the quota status from the DeepSights API at once, fetching both concurrently
+        over the pooled connections of the client, e.g. when starting up.
+
+        Returns:
+
+            Tuple[APIProfile, QuotaStatus]: The parsed API profile and the validated quota status.
+        """
+        if self._cached_profile() is not None:
+            return self.get_profile(), self.get_status()
+
+        with self.api.pipeline() as pipeline:
+            status = pipeline.get_content(_STATUS_PATH)
+            profile = self.get_profile()
+
+        return profile, _parse_status(status.result())
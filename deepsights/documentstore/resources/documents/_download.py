@@ -18,8 +18,9 @@ This module contains the functions to download documents to the DeepSights API.
 
 import os
 import tempfile
-import urllib.request
+from typing import List
 from deepsights.api import APIResource
+from deepsights.utils import run_in_parallel
 from deepsights.documentstore.resources.documents._load import documents_load
 
 
@@ -63,8 +64,54 @@ def document_download(
 
         # download via temp file to prevent partial downloads
         temp_filename = tempfile.mktemp(dir=output_dir)
-        urllib.request.urlretrieve(response["signed_link"], temp_filename)
-        os.rename(temp_filename, local_filename)
+        file = open(temp_filename, "xb")
+        try:
+            with file:
+                resource.api.download(response["signed_link"], file)
+            os.replace(temp_filename, local_filename)
+        except BaseException:
+            os.remove(temp_filename)
+            raise
 
     # return the filename
     return local_filename
+
+
+#################################################
+def documents_download(
+    resource: APIResource,
+    document_ids: List[str],
+    output_dir: str,
+    force_download: bool = False,
+    max_workers: int = 5,
+) -> List[str]:
+    """
+    Download several documents from the DeepSights API concurrently, over the pooled connections of the client.
+
+    Args:
+        resource (APIResource): An instance of the DeepSights API resource.
+        document_ids (List[str]): The IDs of the documents to download.
+        output_dir (str): The local directory to save the downloaded documents in.
+        force_download (bool): If True, the documents will be downloaded even if they already exist locally.
+        max_workers (int, optional): The maximum number of concurrent downloads. Defaults to 5.
+
+    Raises:
+        FileNotFoundError: If the local directory does not exist.
+
+    Returns:
+        List[str]: The local paths of the downloaded documents, in the order of the document IDs.
+    """
+    # check if local path exists
+    if not os.path.exists(output_dir):
+        raise FileNotFoundError(f"Local directory {output_dir} does not exist.")
+
+    # load the documents at once, so the single downloads find them in the cache
+    documents_load(resource, document_ids)
+
+    return run_in_parallel(
+        lambda document_id: document_download(
+            resource, document_id, output_dir, force_download=force_download
+        ),
+        document_ids,
+        max_workers=max_workers,
+    )
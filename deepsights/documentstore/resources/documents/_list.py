@@ -17,11 +17,17 @@ This module contains the functions to list documents from the DeepSights API.
 """
 
 from typing import List
+from pydantic import TypeAdapter
 from deepsights.api import APIResource
 from deepsights.documentstore.resources.documents._model import Document
 from deepsights.documentstore.resources.documents._cache import set_document
 
 
+#############################################
+# validator for a page of documents; built once as adapter construction is expensive
+_DOCUMENTS_ADAPTER = TypeAdapter(List[Document])
+
+
 #################################################
 class SortingOrder:
     """
@@ -97,7 +103,7 @@ def documents_list(
 
     # get results
     total_results = result["total_items"]
-    documents = [Document.model_validate(result) for result in result["items"]]
+    documents = _DOCUMENTS_ADAPTER.validate_python(result["items"])
 
     # set documents
     for document in documents:
@@ -140,7 +140,7 @@ class DocumentSearchResult(DeepSightsIdModel):
     """
 
     page_matches: List[DocumentPageSearchResult] = Field(
-        default=[], description="The matching page search results for the document."
+        default_factory=list, description="The matching page search results for the document."
     )
     rank: Optional[int] = Field(
         default=None, description="The final rank of the item in the search results."
@@ -67,9 +67,9 @@ def document_pages_search(
         "vector-search-service/vectors/_search", params=params, body=body
     )
 
-    # parse
+    # parse; the payload is produced by the trusted DeepSights backend, so skip validation
     results = [
-        DocumentPageSearchResult(
+        DocumentPageSearchResult.model_construct(
             document_id=d["artifact_id"], id=p["part_id"], score=p["score"]
         )
         for d in response["results"]
@@ -150,9 +150,9 @@ def documents_search(
         )
     }
 
-    # now construct the document matches in rank order
+    # now construct the document matches in rank order; all inputs are already parsed models
     results = [
-        DocumentSearchResult(
+        DocumentSearchResult.model_construct(
             id=document_id,
             page_matches=[p for p in page_matches if p.document_id == document_id],
         )
@@ -181,7 +181,7 @@ def documents_search(
         results = promote_exact_matches(query, results)
 
     # record rank
-    for rank, result in enumerate(results):
-        result.rank = rank + 1
+    for rank, result in enumerate(results, 1):
+        result.rank = rank
 
     return results
@@ -22,7 +22,10 @@ from deepsights.documentstore.resources.documents._upload import (
     document_upload,
     document_wait_for_upload,
 )
-from deepsights.documentstore.resources.documents._download import document_download
+from deepsights.documentstore.resources.documents._download import (
+    document_download,
+    documents_download,
+)
 from deepsights.documentstore.resources.documents._delete import (
     documents_delete,
     document_wait_for_deletion,
@@ -54,6 +57,7 @@ class DocumentResource(APIResource):
     load = documents_load
     load_pages = document_pages_load
     download = document_download
+    download_many = documents_download
     search = documents_search
     search_pages = document_pages_search
     list = documents_list
@@ -0,0 +1,142 @@
+# Copyright 2024 Market Logic Software AG. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+This module contains the functions to wait for minion jobs, i.e. answers and reports, to complete.
+"""
+
+import time
+import asyncio
+from typing import Dict
+from deepsights.api import API
+
+
+#################################################
+def _is_done(response: Dict, key: str, label: str, job_id: str) -> bool:
+    """
+    Checks the minion job in a poll response.
+
+    Args:
+
+        response (Dict): The poll response.
+        key (str): The key of the job's resource in the response, e.g. "answer_v2".
+        label (str): The name of the job's resource to use in errors, e.g. "Answer".
+        job_id (str): The ID of the job.
+
+    Returns:
+
+        bool: True if the job has completed, False if it is still running.
+
+    Raises:
+
+        ValueError: If the job failed.
+    """
+    job = response[key]["minion_job"]
+
+    if job["status"] in ("CREATED", "STARTED"):
+        return False
+    if job["status"].startswith("FAILED"):
+        raise ValueError(f"{label} {job_id} failed to complete: {job['error_reason']}")
+
+    return True
+
+
+#################################################
+def wait_for_minion_job(
+    api: API,
+    path: str,
+    key: str,
+    label: str,
+    job_id: str,
+    timeout: int,
+    max_interval: float = 2,
+) -> Dict:
+    """
+    Polls a minion job until it completes.
+
+    Args:
+
+        api (API): The API client to poll with.
+        path (str): The path of the job's resource.
+        key (str): The key of the job's resource in the response, e.g. "answer_v2".
+        label (str): The name of the job's resource to use in errors, e.g. "Answer".
+        job_id (str): The ID of the job.
+        timeout (int): The maximum time to wait for the job to complete, in seconds.
+        max_interval (float, optional): The maximum time between polls, in seconds; polls start 2 seconds apart
+            and back off towards it. Defaults to 2.
+
+    Returns:
+
+        Dict: The final poll response, which holds the full resource.
+
+    Raises:
+
+        ValueError: If the job fails or does not complete in time.
+    """
+    deadline = time.monotonic() + timeout
+    interval = min(2, max_interval)
+    while time.monotonic() < deadline:
+        response = api.get(path)
+        if _is_done(response, key, label, job_id):
+            return response
+
+        time.sleep(min(interval, max(0, deadline - time.monotonic())))
+        interval = min(interval * 1.5, max_interval)
+
+    raise ValueError(f"{label} {job_id} failed to complete within {timeout} seconds.")
+
+
+#################################################
+async def wait_for_minion_job_async(
+    api: API,
+    path: str,
+    key: str,
+    label: str,
+    job_id: str,
+    timeout: int,
+    max_interval: float = 2,
+) -> Dict:
+    """
+    Polls a minion job until it completes, without blocking the event loop.
+
+    Args:
+
+        api (API): The API client to poll with.
+        path (str): The path of the job's resource.
+        key (str): The key of the job's resource in the response, e.g. "answer_v2".
+        label (str): The name of the job's resource to use in errors, e.g. "Answer".
+        job_id (str): The ID of the job.
+        timeout (int): The maximum time to wait for the job to complete, in seconds.
+        max_interval (float, optional): The maximum time between polls, in seconds; polls start 2 seconds apart
+            and back off towards it. Defaults to 2.
+
+    Returns:
+
+        Dict: The final poll response, which holds the full resource.
+
+    Raises:
+
+        ValueError: If the job fails or does not complete in time.
+    """
+    deadline = time.monotonic() + timeout
+    interval = min(2, max_interval)
+    while time.monotonic() < deadline:
+        response = await api.aget(path)
+        if _is_done(response, key, label, job_id):
+            return response
+
+        await asyncio.sleep(min(interval, max(0, deadline - time.monotonic())))
+        interval = min(interval * 1.5, max_interval)
+
+    raise ValueError(f"{label} {job_id} failed to complete within {timeout} seconds.")
@@ -98,7 +98,7 @@ class DocumentEvidence(Evidence):
     pages: List[DocumentPageEvidence] = Field(
         alias="page_references",
         description="The list of pages in the document where the evidence is found.",
-        default=[],
+        default_factory=list,
     )
 
 
@@ -16,12 +16,74 @@
 This module contains the functions to retrieve reports from the DeepSights self.
 """
 
-import time
-from ratelimit import sleep_and_retry, limits
-from deepsights.api import APIResource
+from typing import Dict, List
+from deepsights.api import APIResource, throttled
+from deepsights.utils import run_in_parallel
+from deepsights.userclient.resources._minion import (
+    wait_for_minion_job,
+    wait_for_minion_job_async,
+)
 from deepsights.userclient.resources.answersV2._model import AnswerV2
 
 
+#################################################
+def _parse_answer(response: Dict) -> AnswerV2:
+    """
+    Parses an answer from the DeepSights API response.
+
+    Args:
+
+        response (Dict): The response of the answers V2 endpoint.
+
+    Returns:
+
+        AnswerV2: The parsed answer.
+    """
+    if response["permission_validation_result"] == "RESTRICTED":
+        return AnswerV2(
+            **dict(
+                permission_validation=response["permission_validation_result"],
+                id=response["restricted_answer_v2"]["answer_v2_id"],
+                status="n/a",
+                question=response["restricted_answer_v2"]["input"],
+                answer="n/a",
+                watchouts="n/a",
+                document_sources=[],
+                secondary_sources=[],
+                news_sources=[],
+                document_suggestions=[],
+                secondary_suggestions=[],
+                news_suggestions=[],
+            )
+        )
+    else:
+        return AnswerV2(
+            **dict(
+                permission_validation=response["permission_validation_result"],
+                id=response["answer_v2"]["minion_job"]["id"],
+                status=response["answer_v2"]["minion_job"]["status"],
+                question=response["answer_v2"]["context"]["input"],
+                answer=response["answer_v2"]["context"]["summary"]["answer"],
+                watchouts=response["answer_v2"]["context"]["summary"]["watchouts"],
+                document_sources=response["answer_v2"]["context"]["avs_results"]
+                or [],
+                secondary_sources=response["answer_v2"]["context"]["srs_results"]
+                or [],
+                news_sources=response["answer_v2"]["context"]["sns_results"] or [],
+                document_suggestions=response["answer_v2"]["context"][
+                    "avs_suggestions"
+                ]
+                or [],
+                secondary_suggestions=response["answer_v2"]["context"][
+                    "srs_suggestions"
+                ]
+                or [],
+                news_suggestions=response["answer_v2"]["context"]["sns_suggestions"]
+                or [],
+            )
+        )
+
+
 #################################################
 class AnswerV2Resource(APIResource):
     """
@@ -29,8 +91,7 @@ class AnswerV2Resource(APIResource):
     """
 
     #################################################
-    @sleep_and_retry
-    @limits(calls=3, period=60)
+    @throttled(calls=3, period=60)
     def create(self, question: str) -> str:
         """
         Creates a new answer V2 by submitting a question to the DeepSights self.
@@ -51,6 +112,24 @@ class AnswerV2Resource(APIResource):
 
         return response["answer_v2"]["minion_job"]["id"]
 
+    #################################################
+    def create_many(self, questions: List[str], max_workers=5) -> List[str]:
+        """
+        Creates new answers V2 for several questions, submitting them concurrently.
+        The API offers no batch endpoint, so this overlaps the individual requests; they still count
+        against the rate limit of `create`.
+
+        Args:
+
+            questions (List[str]): The questions to be submitted for the answers.
+            max_workers (int, optional): The maximum number of concurrent submissions. Defaults to 5.
+
+        Returns:
+
+            List[str]: The IDs of the created answers' minion jobs, in the order of the questions.
+        """
+        return run_in_parallel(self.create, questions, max_workers=max_workers)
+
     #################################################
     def wait_for_answer(self, answer_id: str, timeout=90) -> AnswerV2:
         """
@@ -69,26 +148,48 @@ class AnswerV2Resource(APIResource):
 
             ValueError: If the answer fails to complete.
         """
-        # wait for completion
-        start = time.time()
-        while time.time() - start < timeout:
-            response = self.api.get(f"end-user-gateway-service/answers-v2/{answer_id}")[
-                "answer_v2"
-            ]["minion_job"]
-
-            if response["status"] in ("CREATED", "STARTED"):
-                time.sleep(2)
-            elif response["status"].startswith("FAILED"):
-                raise ValueError(
-                    f"Answer {answer_id} failed to complete: {response['error_reason']}"
-                )
-            else:
-                return self.get(answer_id)
-
-        raise ValueError(
-            f"Answer {answer_id} failed to complete within {timeout} seconds."
+        # the polled payload is the full answer, so no extra request once done
+        response = wait_for_minion_job(
+            self.api,
+            f"end-user-gateway-service/answers-v2/{answer_id}",
+            "answer_v2",
+            "Answer",
+            answer_id,
+            timeout,
         )
 
+        return _parse_answer(response)
+
+    #################################################
+    async def wait_for_answer_async(self, answer_id: str, timeout=90) -> AnswerV2:
+        """
+        Waits for the completion of an answer without blocking the event loop.
+
+        Args:
+
+            answer_id (str): The ID of the answer.
+            timeout (int, optional): The maximum time to wait for the answer to complete, in seconds. Defaults to 90.
+
+        Returns:
+
+                AnswerV2: The completed answer.
+
+        Raises:
+
+            ValueError: If the answer fails to complete.
+        """
+        # the polled payload is the full answer, so no extra request once done
+        response = await wait_for_minion_job_async(
+            self.api,
+            f"end-user-gateway-service/answers-v2/{answer_id}",
+            "answer_v2",
+            "Answer",
+            answer_id,
+            timeout,
+        )
+
+        return _parse_answer(response)
+
     #################################################
     def get(self, answer_id: str) -> AnswerV2:
         """
@@ -104,50 +205,8 @@ class AnswerV2Resource(APIResource):
         """
         response = self.api.get(f"end-user-gateway-service/answers-v2/{answer_id}")
 
-        if response["permission_validation_result"] == "RESTRICTED":
-            return AnswerV2(
-                **dict(
-                    permission_validation=response["permission_validation_result"],
-                    id=response["restricted_answer_v2"]["answer_v2_id"],
-                    status="n/a",
-                    question=response["restricted_answer_v2"]["input"],
-                    answer="n/a",
-                    watchouts="n/a",
-                    document_sources=[],
-                    secondary_sources=[],
-                    news_sources=[],
-                    document_suggestions=[],
-                    secondary_suggestions=[],
-                    news_suggestions=[],
-                )
-            )
-        else:
-            return AnswerV2(
-                **dict(
-                    permission_validation=response["permission_validation_result"],
-                    id=response["answer_v2"]["minion_job"]["id"],
-                    status=response["answer_v2"]["minion_job"]["status"],
-                    question=response["answer_v2"]["context"]["input"],
-                    answer=response["answer_v2"]["context"]["summary"]["answer"],
-                    watchouts=response["answer_v2"]["context"]["summary"]["watchouts"],
-                    document_sources=response["answer_v2"]["context"]["avs_results"]
-                    or [],
-                    secondary_sources=response["answer_v2"]["context"]["srs_results"]
-                    or [],
-                    news_sources=response["answer_v2"]["context"]["sns_results"] or [],
-                    document_suggestions=response["answer_v2"]["context"][
-                        "avs_suggestions"
-                    ]
-                    or [],
-                    secondary_suggestions=response["answer_v2"]["context"][
-                        "srs_suggestions"
-                    ]
-                    or [],
-                    news_suggestions=response["answer_v2"]["context"]["sns_suggestions"]
-                    or [],
-                )
-            )
-        
+        return _parse_answer(response)
+
     #################################################
     def create_and_wait(self, question: str, timeout=60) -> AnswerV2:
         """
@@ -163,4 +222,23 @@ class AnswerV2Resource(APIResource):
 
             AnswerV2: The answer.
         """
-        return self.wait_for_answer(self.create(question), timeout=timeout)
\ No newline at end of file
+        return self.wait_for_answer(self.create(question), timeout=timeout)
+
+    #################################################
+    async def create_and_wait_async(self, question: str, timeout=60) -> AnswerV2:
+        """
+        Submits a question to the DeepSights API and waits for the answer to complete, without blocking the event loop.
+        Use with `asyncio.gather` to obtain answers to several questions concurrently.
+
+        Args:
+
+            question (str): The question to be submitted for the answers.
+            timeout (int, optional): The maximum time to wait for the answer to complete, in seconds. Defaults to 60.
+
+        Returns:
+
+            AnswerV2: The answer.
+        """
+        # run on the client's worker threads like its other async calls, as the throttled create may sleep
+        answer_id = await self.api.run_async(self.create, question)
+        return await self.wait_for_answer_async(answer_id, timeout=timeout)
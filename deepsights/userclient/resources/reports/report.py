@@ -16,12 +16,66 @@
 This module contains the functions to retrieve reports from the DeepSights self.
 """
 
-import time
-from ratelimit import sleep_and_retry, limits
-from deepsights.api import APIResource
+from typing import Dict
+from deepsights.api import APIResource, throttled
+from deepsights.userclient.resources._minion import (
+    wait_for_minion_job,
+    wait_for_minion_job_async,
+)
 from deepsights.userclient.resources.reports._model import Report
 
 
+#################################################
+def _parse_report(response: Dict) -> Report:
+    """
+    Parses a report from the DeepSights API response.
+
+    Args:
+
+        response (Dict): The response of the desk researches endpoint.
+
+    Returns:
+
+        Report: The parsed report.
+    """
+    if response["permission_validation_result"] == "RESTRICTED":
+        return Report(
+            **dict(
+                permission_validation=response["permission_validation_result"],
+                id=response["restricted_desk_research"]["desk_research_id"],
+                status="n/a",
+                question=response["restricted_desk_research"]["input"],
+                topic="n/a",
+                summary="n/a",
+                document_sources=[],
+                secondary_sources=[],
+                news_sources=[],
+            )
+        )
+    else:
+        return Report(
+            **dict(
+                permission_validation=response["permission_validation_result"],
+                id=response["desk_research"]["minion_job"]["id"],
+                status=response["desk_research"]["minion_job"]["status"],
+                question=response["desk_research"]["context"]["input"],
+                topic=response["desk_research"]["context"]["topic"],
+                summary=response["desk_research"]["context"]["summary"],
+                document_sources=response["desk_research"]["context"][
+                    "artifact_vector_search_results"
+                ] or [],
+                secondary_sources=response["desk_research"]["context"][
+                    "scs_report_search_results"
+                ]
+                or [],
+                news_sources=response["desk_research"]["context"][
+                    "scs_news_search_results"
+                ]
+                or [],
+            )
+        )
+
+
 #################################################
 class ReportResource(APIResource):
     """
@@ -29,8 +83,7 @@ class ReportResource(APIResource):
     """
 
     #################################################
-    @sleep_and_retry
-    @limits(calls=3, period=60)
+    @throttled(calls=3, period=60)
     def create(self, question: str) -> str:
         """
         Creates a new report by submitting a question to the DeepSights self.
@@ -51,6 +104,21 @@ class ReportResource(APIResource):
 
         return response["desk_research"]["minion_job"]["id"]
 
+    #################################################
+    async def create_async(self, question: str) -> str:
+        """
+        Creates a new report without blocking the event loop; the throttled call runs on the client's worker threads.
+
+        Args:
+
+            question (str): The question to be submitted for the report.
+
+        Returns:
+
+            str: The ID of the created report's minion job.
+        """
+        return await self.api.run_async(self.create, question)
+
     #################################################
     def wait_for_report(self, report_id: str, timeout=600) -> Report:
         """
@@ -69,26 +137,50 @@ class ReportResource(APIResource):
 
             ValueError: If the report fails to complete.
         """
-        # wait for completion
-        start = time.time()
-        while time.time() - start < timeout:
-            response = self.api.get(
-                f"end-user-gateway-service/desk-researches/{report_id}"
-            )["desk_research"]["minion_job"]
-
-            if response["status"] in ("CREATED", "STARTED"):
-                time.sleep(2)
-            elif response["status"].startswith("FAILED"):
-                raise ValueError(
-                    f"Report {report_id} failed to complete: {response['error_reason']}"
-                )
-            else:
-                return self.get(report_id)
-
-        raise ValueError(
-            f"Report {report_id} failed to complete within {timeout} seconds."
+        # the polled payload is the full report, so no extra request once done
+        response = wait_for_minion_job(
+            self.api,
+            f"end-user-gateway-service/desk-researches/{report_id}",
+            "desk_research",
+            "Report",
+            report_id,
+            timeout,
+            max_interval=10,
         )
 
+        return _parse_report(response)
+
+    #################################################
+    async def wait_for_report_async(self, report_id: str, timeout=600) -> Report:
+        """
+        Waits for the completion of a report without blocking the event loop.
+
+        Args:
+
+            report_id (str): The ID of the report.
+            timeout (int, optional): The maximum time to wait for the report to complete, in seconds. Defaults to 600.
+
+        Returns:
+
+            Report: The completed report.
+
+        Raises:
+
+            ValueError: If the report fails to complete.
+        """
+        # the polled payload is the full report, so no extra request once done
+        response = await wait_for_minion_job_async(
+            self.api,
+            f"end-user-gateway-service/desk-researches/{report_id}",
+            "desk_research",
+            "Report",
+            report_id,
+            timeout,
+            max_interval=10,
+        )
+
+        return _parse_report(response)
+
     #################################################
     def get(self, report_id: str) -> Report:
         """
@@ -104,39 +196,4 @@ class ReportResource(APIResource):
         """
         response = self.api.get(f"end-user-gateway-service/desk-researches/{report_id}")
 
-        if response["permission_validation_result"] == "RESTRICTED":
-            return Report(
-                **dict(
-                    permission_validation=response["permission_validation_result"],
-                    id=response["restricted_desk_research"]["desk_research_id"],
-                    status="n/a",
-                    question=response["restricted_desk_research"]["input"],
-                    topic="n/a",
-                    summary="n/a",
-                    document_sources=[],
-                    secondary_sources=[],
-                    news_sources=[],
-                )
-            )
-        else:
-            return Report(
-                **dict(
-                    permission_validation=response["permission_validation_result"],
-                    id=response["desk_research"]["minion_job"]["id"],
-                    status=response["desk_research"]["minion_job"]["status"],
-                    question=response["desk_research"]["context"]["input"],
-                    topic=response["desk_research"]["context"]["topic"],
-                    summary=response["desk_research"]["context"]["summary"],
-                    document_sources=response["desk_research"]["context"][
-                        "artifact_vector_search_results"
-                    ] or [],
-                    secondary_sources=response["desk_research"]["context"][
-                        "scs_report_search_results"
-                    ]
-                    or [],
-                    news_sources=response["desk_research"]["context"][
-                        "scs_news_search_results"
-                    ]
-                    or [],
-                )
-            )
+        return _parse_report(response)
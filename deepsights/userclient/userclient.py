@@ -16,10 +16,35 @@
 This module contains the user client for the DeepSights API, impersonating a given user.
 """
 
+import json
+import base64
+from typing import Optional
 from deepsights.api.api import OAuthTokenAPI
 from deepsights.userclient.resources import AnswerV2Resource, ReportResource
 
 
+#################################################
+def _token_expiry(oauth_token: str) -> Optional[float]:
+    """
+    Reads the expiry time of an OAuth token, if it is a JWT with an "exp" claim. The signature is not verified,
+    as the expiry is only used to drop the token from the cache in time.
+
+    Args:
+
+        oauth_token (str): The OAuth token.
+
+    Returns:
+
+        Optional[float]: The expiry time as a Unix timestamp, or None.
+    """
+    try:
+        payload = oauth_token.split(".")[1]
+        claims = json.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+        return float(claims["exp"])
+    except (IndexError, KeyError, TypeError, ValueError):
+        return None
+
+
 #################################################
 class UserClient(OAuthTokenAPI):
     """
@@ -28,6 +53,7 @@ class UserClient(OAuthTokenAPI):
 
     answersV2: AnswerV2Resource
     reports: ReportResource
+    token_expiry: Optional[float]
 
     #######################################
     def __init__(self, oauth_token: str) -> None:
@@ -43,5 +69,8 @@ class UserClient(OAuthTokenAPI):
             oauth_token=oauth_token,
         )
 
+        # read once, so the expiry is at hand e.g. for dropping the client from caches in time
+        self.token_expiry = _token_expiry(oauth_token)
+
         self.answersV2 = AnswerV2Resource(self)
         self.reports = ReportResource(self)
@@ -102,47 +102,26 @@ def promote_exact_matches(query: str, results: List) -> List:
 
         List: The search results with exact and partial matches promoted.
     """
-    # determine terms in the query
+    # determine terms in the query, and compile their patterns once for all results
     terms = shlex.split(query)
-
-    # find documents with exact title matches, using regex
-    exact_matches = [
-        item.id
-        for item in results
-        if all(
-            re.search(
-                rf"(?:\b|\s|^){re.escape(term)}(?:\b|\s|$|\W)",
-                item.title,
-                re.IGNORECASE,
-            )
-            is not None
-            for term in terms
-        )
+    exact_patterns = [
+        re.compile(rf"(?:\b|\s|^){re.escape(term)}(?:\b|\s|$|\W)", re.IGNORECASE)
+        for term in terms
     ]
-
-    # find documents with starting substring title matches, using regex
-    substring_matches = [
-        item.id
-        for item in results
-        if not item.id in exact_matches
-        and all(
-            re.search(
-                rf"(?:\b|\s|^){re.escape(term)}",
-                item.title,
-                re.IGNORECASE,
-            )
-            is not None
-            for term in terms
-        )
+    substring_patterns = [
+        re.compile(rf"(?:\b|\s|^){re.escape(term)}", re.IGNORECASE) for term in terms
     ]
 
+    # rank documents with exact title matches first, then with starting substring title matches
+    def _match_rank(item) -> int:
+        if all(pattern.search(item.title) for pattern in exact_patterns):
+            return 0
+        if all(pattern.search(item.title) for pattern in substring_patterns):
+            return 1
+        return 2
+
     # now re-rank to put docs with exact matches first, then with partial matches, then the rest in original order
-    results = sorted(
-        results,
-        key=lambda x: (
-            0 if x.id in exact_matches else 1 if x.id in substring_matches else 2
-        ),
-    )
+    results = sorted(results, key=_match_rank)
 
     return results
 
@@ -165,13 +144,13 @@ def rerank_by_recency(
     
         List: The reranked search results.
     """
-    # record score rank
-    score_ranks = {}
-    for rank, result in enumerate(results):
-        score_ranks[result.id] = rank
-
-    # apply recency weight
+    # apply recency weight; without it, only the ranks are recorded
     if recency_weight:
+        # record score rank
+        score_ranks = {}
+        for rank, result in enumerate(results):
+            score_ranks[result.id] = rank
+
         # calculate age in days
         age_by_item_id = {}
         for r in results:
@@ -194,7 +173,7 @@ def rerank_by_recency(
         )
 
     # record rank
-    for rank, result in enumerate(results):
-        result.rank = rank + 1
+    for rank, result in enumerate(results, 1):
+        result.rank = rank
 
     return results
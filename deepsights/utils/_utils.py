@@ -16,13 +16,50 @@
 This module contains threading utility functions used by the DeepSights API.
 """
 
-import concurrent.futures
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+
+#################################################
+# worker threads shared by all parallel runs, so runs do not pay for starting and stopping threads;
+# each run still caps its own concurrency at its max_workers
+_EXECUTOR_THREADS = 32
+
+# marks the shared worker threads, so that nested runs execute inline instead of waiting for a free worker
+_WORKER = threading.local()
+
+
+#################################################
+def _mark_worker():
+    """
+    Marks the current thread as a shared worker thread.
+    """
+    _WORKER.active = True
+
+
+#################################################
+@lru_cache(maxsize=None)
+def _get_executor():
+    """
+    Returns the shared executor, creating it on first use.
+
+    Returns:
+
+        ThreadPoolExecutor: The shared executor.
+    """
+    return ThreadPoolExecutor(
+        max_workers=_EXECUTOR_THREADS,
+        thread_name_prefix="deepsights-parallel",
+        initializer=_mark_worker,
+    )
 
 
 #################################################
 def run_in_parallel(fun, args, max_workers=5):
     """
-    Executes the given function in parallel using multiple threads.
+    Executes the given function in parallel using multiple threads: the calling thread and further threads
+    taken from a shared pool. Calls from within a parallel run are executed inline.
 
     Args:
 
@@ -32,14 +69,45 @@ def run_in_parallel(fun, args, max_workers=5):
 
     Returns:
     
-        list: A list of results returned by the function for each argument.
+        list: A list of results returned by the function for each argument, in the order of the arguments.
     """
-    results = []
+    args = list(args)
+    if len(args) <= 1 or max_workers <= 1 or getattr(_WORKER, "active", False):
+        return [fun(arg) for arg in args]
+
+    results = [None] * len(args)
+    errors = [None] * len(args)
+    indices = iter(range(len(args)))
+    indices_lock = threading.Lock()
+
+    # each worker takes the next argument until none is left
+    def _work():
+        while True:
+            with indices_lock:
+                index = next(indices, None)
+            if index is None:
+                return
+
+            try:
+                results[index] = fun(args[index])
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                # any error is the caller's, raised in argument order once all workers are done
+                errors[index] = e
+
+    # the calling thread works along instead of idling, so one thread fewer is taken from the pool
+    executor = _get_executor()
+    workers = [executor.submit(_work) for _ in range(min(max_workers, len(args)) - 1)]
+    _work()
+
+    # all arguments are taken once the caller is done; workers still queued behind other runs would find
+    # nothing left, so they are cancelled rather than waited for, and only the running ones are awaited
+    for worker in workers:
+        if not worker.cancel():
+            worker.result()
 
-    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
-        futures = [executor.submit(fun, arg) for arg in args]
-        results = [
-            future.result() for future in concurrent.futures.as_completed(futures)
-        ]
+    # raise the error of the first failed argument, as waiting on the results in order would
+    for error in errors:
+        if error is not None:
+            raise error
 
     return results
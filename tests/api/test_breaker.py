@@ -0,0 +1,126 @@
+# Copyright 2024 Market Logic Software AG. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+This module contains the tests for the circuit breaker of the API clients; they run offline with a fake clock.
+"""
+
+import pytest
+import requests
+
+from deepsights.api import _breaker
+from deepsights.api import CircuitOpenError
+
+
+class FakeClock:
+    """
+    Stands in for the time module, advancing only when told to.
+    """
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        """
+        Returns the current fake time.
+        """
+        return self.now
+
+
+@pytest.fixture(name="clock")
+def fixture_clock(monkeypatch):
+    """
+    Replaces the time module of `_breaker` with a fake clock.
+    """
+    fake = FakeClock()
+    monkeypatch.setattr(_breaker, "time", fake)
+    return fake
+
+
+@pytest.mark.usefixtures("clock")
+def test_breaker_opens_after_consecutive_failures():
+    """
+    Test case for opening the breaker after fail_max consecutive failures only.
+    """
+    breaker = _breaker.CircuitBreaker("example.com", fail_max=3, reset_timeout=30)
+
+    breaker.failure()
+    breaker.failure()
+    breaker.success()
+    breaker.failure()
+    breaker.failure()
+    breaker.check()
+
+    breaker.failure()
+    with pytest.raises(CircuitOpenError):
+        breaker.check()
+
+
+def test_breaker_half_open(clock):
+    """
+    Test case for letting a single trial call through once the reset timeout has passed.
+    """
+    breaker = _breaker.CircuitBreaker("example.com", fail_max=1, reset_timeout=30)
+    breaker.failure()
+
+    clock.now += 29
+    with pytest.raises(CircuitOpenError):
+        breaker.check()
+
+    # the trial call passes, while others are rejected for another timeout
+    clock.now += 1
+    breaker.check()
+    with pytest.raises(CircuitOpenError):
+        breaker.check()
+
+    # a failed trial keeps the breaker open
+    breaker.failure()
+    clock.now += 29
+    with pytest.raises(CircuitOpenError):
+        breaker.check()
+
+
+def test_breaker_closes_on_success(clock):
+    """
+    Test case for closing the breaker when the trial call succeeds.
+    """
+    breaker = _breaker.CircuitBreaker("example.com", fail_max=2, reset_timeout=30)
+    breaker.failure()
+    breaker.failure()
+
+    clock.now += 30
+    breaker.check()
+    breaker.success()
+
+    breaker.check()
+    breaker.check()
+
+    # the failures are counted anew
+    breaker.failure()
+    breaker.check()
+
+
+def test_breaker_error_is_request_exception():
+    """
+    Test case for catching the breaker's error with existing handlers.
+    """
+    assert issubclass(CircuitOpenError, requests.exceptions.RequestException)
+
+
+def test_breaker_shared_per_host():
+    """
+    Test case for sharing one breaker per host.
+    """
+    assert _breaker.get_breaker("a.example.com") is _breaker.get_breaker("a.example.com")
+    assert _breaker.get_breaker("a.example.com") is not _breaker.get_breaker("b.example.com")
@@ -0,0 +1,263 @@
+# Copyright 2024 Market Logic Software AG. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+This module contains the tests for the rate limiting and backoff of the API clients; they run offline with a fake clock.
+"""
+
+import pytest
+from requests import Response
+
+from deepsights.api import _ratelimit
+from deepsights.api import RateLimitError, TokenBucket
+
+
+class FakeClock:
+    """
+    Stands in for the time module; sleeping advances the clock and is recorded.
+    """
+
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+    def monotonic(self):
+        """
+        Returns the current fake time.
+        """
+        return self.now
+
+    def sleep(self, seconds):
+        """
+        Records the sleep and advances the fake time by it.
+        """
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture(name="clock")
+def fixture_clock(monkeypatch):
+    """
+    Replaces the time module of `_ratelimit` with a fake clock.
+    """
+    fake = FakeClock()
+    monkeypatch.setattr(_ratelimit, "time", fake)
+    return fake
+
+
+def make_response(status_code, **headers):
+    """
+    Creates a response with the given status code and headers.
+    """
+    response = Response()
+    response.status_code = status_code
+    response.headers.update(headers)
+    return response
+
+
+def test_bucket_burst(clock):
+    """
+    Test case for taking the full capacity of a bucket without sleeping.
+    """
+    bucket = TokenBucket(10, 60)
+    for _ in range(10):
+        bucket.acquire()
+
+    assert clock.sleeps == []
+
+
+def test_bucket_refill(clock):
+    """
+    Test case for sleeping until the next token once the bucket is empty, and refilling over time.
+    """
+    bucket = TokenBucket(10, 60)
+    for _ in range(10):
+        bucket.acquire()
+
+    bucket.acquire()
+    assert sum(clock.sleeps) == pytest.approx(6)
+
+    # half the period refills half the capacity
+    clock.sleeps.clear()
+    clock.now += 30
+    for _ in range(5):
+        bucket.acquire()
+    assert clock.sleeps == []
+
+
+def test_bucket_penalty(clock):
+    """
+    Test case for pausing the bucket for the time requested by the server.
+    """
+    bucket = TokenBucket(10, 60)
+    bucket.penalize(12)
+
+    bucket.acquire()
+    assert sum(clock.sleeps) == pytest.approx(12)
+
+
+def test_bucket_penalty_capped(clock):
+    """
+    Test case for capping server-imposed pauses at the maximum penalty.
+    """
+    bucket = TokenBucket(10, 60)
+    bucket.penalize(86400)
+    bucket.acquire()
+    assert sum(clock.sleeps) == pytest.approx(60)
+
+    clock.sleeps.clear()
+    bucket = TokenBucket(10, 60, max_penalty=5)
+    bucket.penalize(86400)
+    bucket.acquire()
+    assert sum(clock.sleeps) == pytest.approx(5)
+
+
+def test_bucket_acquire_timeout(clock):
+    """
+    Test case for failing rather than sleeping when the next token is further away than the timeout.
+    """
+    bucket = TokenBucket(10, 60)
+    bucket.penalize(30)
+
+    with pytest.raises(RateLimitError):
+        bucket.acquire(timeout=15)
+    assert clock.sleeps == []
+
+    bucket.acquire(timeout=45)
+    assert sum(clock.sleeps) == pytest.approx(30)
+
+
+def test_bucket_observe_retry_after(clock):
+    """
+    Test case for pausing the bucket by the Retry-After of a rate-limited response, capped at the maximum penalty.
+    """
+    bucket = TokenBucket(10, 60)
+    bucket.observe(make_response(429, **{"Retry-After": "86400"}))
+
+    with pytest.raises(RateLimitError):
+        bucket.acquire(timeout=15)
+
+    bucket.acquire()
+    assert sum(clock.sleeps) == pytest.approx(60)
+
+
+def test_bucket_observe_remaining(clock):
+    """
+    Test case for capping the tokens to the calls the server still accepts.
+    """
+    bucket = TokenBucket(10, 60)
+    bucket.observe(make_response(200, **{"RateLimit-Remaining": "2"}))
+
+    bucket.acquire()
+    bucket.acquire()
+    assert clock.sleeps == []
+
+    bucket.acquire()
+    assert sum(clock.sleeps) == pytest.approx(6)
+
+
+def test_bucket_observe_reset(clock):
+    """
+    Test case for pausing the bucket until the server's reset, capped at the maximum penalty,
+    e.g. when the reset is given as a timestamp.
+    """
+    bucket = TokenBucket(10, 60)
+    bucket.observe(
+        make_response(200, **{"RateLimit-Remaining": "0", "RateLimit-Reset": "20"})
+    )
+    bucket.acquire()
+    assert sum(clock.sleeps) == pytest.approx(20)
+
+    clock.sleeps.clear()
+    bucket = TokenBucket(10, 60)
+    bucket.observe(
+        make_response(
+            200, **{"RateLimit-Remaining": "0", "RateLimit-Reset": "1767225600"}
+        )
+    )
+    bucket.acquire()
+    assert sum(clock.sleeps) == pytest.approx(60)
+
+
+def test_bucket_observe_ignores_invalid_headers(clock):
+    """
+    Test case for ignoring missing and malformed rate limit headers.
+    """
+    bucket = TokenBucket(10, 60)
+    bucket.observe(make_response(429))
+    bucket.observe(make_response(429, **{"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"}))
+    bucket.observe(make_response(200, **{"RateLimit-Remaining": "many"}))
+
+    for _ in range(10):
+        bucket.acquire()
+    assert clock.sleeps == []
+
+
+class UpperBound:
+    """
+    Stands in for the random module, always returning the upper bound.
+    """
+
+    @staticmethod
+    def uniform(_low, high):
+        """
+        Returns the upper bound.
+        """
+        return high
+
+
+def test_backoff_retry_after():
+    """
+    Test case for honoring the server's Retry-After up to the given maximum.
+    """
+    backoff = _ratelimit.AdaptiveBackoff()
+    key = ("example.com", "search")
+
+    assert backoff.next_delay(key, 1, 5, make_response(429, **{"Retry-After": "2"})) == 2
+    assert backoff.next_delay(key, 1, 5, make_response(429, **{"Retry-After": "30"})) == 30
+    assert (
+        backoff.next_delay(key, 1, 5, make_response(429, **{"Retry-After": "86400"}))
+        is None
+    )
+    assert (
+        backoff.next_delay(
+            key, 1, 5, make_response(429, **{"Retry-After": "10"}), max_retry_after=5
+        )
+        is None
+    )
+
+
+def test_backoff_adapts_to_denials(monkeypatch):
+    """
+    Test case for stretching the randomized exponential delay by the share of rate-limited calls per key.
+    """
+    monkeypatch.setattr(_ratelimit, "random", UpperBound)
+
+    backoff = _ratelimit.AdaptiveBackoff(window=4)
+    key = ("example.com", "search")
+
+    assert backoff.next_delay(key, 1, 5) == 2
+    assert backoff.next_delay(key, 3, 5) == 5
+
+    for _ in range(4):
+        backoff.record(key, True)
+    assert backoff.next_delay(key, 1, 5) == 6
+
+    # only the window of recent outcomes counts
+    backoff.record(key, False)
+    backoff.record(key, False)
+    assert backoff.next_delay(key, 1, 5) == 4
+
+    # other keys are not affected
+    assert backoff.next_delay(("example.com", "other"), 1, 5) == 2
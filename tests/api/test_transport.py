@@ -0,0 +1,238 @@
+# Copyright 2024 Market Logic Software AG. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+This module contains the tests for the request handling of the API clients; they run offline against a local server.
+"""
+
+import gc
+import math
+import logging
+import time
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+from deepsights.api import APIKeyAPI, CircuitOpenError, RateLimitError
+from deepsights.api import api as api_module
+from deepsights.api.api import json_dumps
+
+
+class Handler(BaseHTTPRequestHandler):
+    """
+    Answers GET /status/<code> with that status code, and everything else with a large body.
+    """
+
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def _reply(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        if length:
+            self.rfile.read(length)
+
+        body, status_code = b"{}", 200
+        if self.path.startswith("/status/"):
+            status_code = int(self.path.split("/")[2])
+        elif self.path.startswith("/big"):
+            body = b"[" + b"0," * 500000 + b"0]"
+
+        self.send_response(status_code)
+        if status_code == 429:
+            self.send_header("Retry-After", "86400")
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(body)
+
+    do_GET = do_POST = do_HEAD = _reply
+
+
+@pytest.fixture(name="endpoint")
+def fixture_endpoint():
+    """
+    Serves `Handler` on a local port; each test gets a server of its own, i.e. a host with fresh rate limits
+    and circuit breaker.
+    """
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    yield f"http://127.0.0.1:{server.server_address[1]}/"
+
+    server.shutdown()
+    server.server_close()
+
+
+def test_long_retry_after_fails_fast(endpoint):
+    """
+    Test case for failing at once when the server asks to retry after a day, instead of blocking the caller.
+    """
+    api = APIKeyAPI(endpoint, "key")
+
+    start = time.monotonic()
+    with pytest.raises(RateLimitError) as exc:
+        api.get("status/429", timeout=2)
+    assert exc.value.response.status_code == 429
+
+    # the host's rate limit is paused by the server's hint, which fails later calls rather than blocking them
+    with pytest.raises(RateLimitError):
+        api.get("other", timeout=2)
+
+    assert time.monotonic() - start < 2
+
+
+def test_exhausted_pool_does_not_block(endpoint, caplog):
+    """
+    Test case for calling on while all pooled connections are held by unconsumed streams,
+    warning once about the exhausted pool.
+    """
+    api = APIKeyAPI(endpoint, "key", pool_maxsize=1)
+
+    stream = api.get_stream("big")
+    with caplog.at_level(logging.WARNING, logger="deepsights.api"):
+        assert api.get("other", timeout=2) == {}
+        assert api.get("other", timeout=2) == {}
+    stream.close()
+
+    assert len([r for r in caplog.records if "pooled connections" in r.getMessage()]) == 1
+
+
+def test_stream_closed_before_iteration(endpoint, monkeypatch):
+    """
+    Test case for releasing the connection of a stream that is closed or dropped without being iterated.
+    """
+    closed = []
+    close = requests.Response.close
+    monkeypatch.setattr(
+        requests.Response, "close", lambda self: closed.append(self.url.endswith("/big")) or close(self)
+    )
+    api = APIKeyAPI(endpoint, "key")
+
+    with api.get_stream("big"):
+        assert not any(closed)
+    assert any(closed)
+
+    stream = api.get_stream("big")
+    closed.clear()
+    stream.close()
+    assert any(closed)
+
+    stream = api.get_stream("big")
+    closed.clear()
+    del stream
+    gc.collect()
+    assert any(closed)
+
+
+def test_stream_consumed(endpoint):
+    """
+    Test case for streaming the full body.
+    """
+    api = APIKeyAPI(endpoint, "key")
+
+    assert b"".join(api.get_stream("big", chunk_size=1000)) == b"[" + b"0," * 500000 + b"0]"
+
+
+def test_breaker_opens_on_server_errors(endpoint):
+    """
+    Test case for rejecting calls once the host has failed too often in a row.
+    """
+    api = APIKeyAPI(endpoint, "key")
+
+    # POST requests are not retried on server errors, so each call is one failure
+    for _ in range(5):
+        with pytest.raises(Exception) as exc:
+            api.post("status/500", body={})
+        assert not isinstance(exc.value, CircuitOpenError)
+
+    with pytest.raises(CircuitOpenError):
+        api.get("other")
+
+
+def test_breaker_counts_calls_not_attempts(endpoint, monkeypatch):
+    """
+    Test case for counting a retried call once towards the breaker, however many attempts it took.
+    """
+    monkeypatch.setattr(api_module, "_MAX_WAIT", 0)
+    api = APIKeyAPI(endpoint, "key")
+
+    # GET requests are retried on gateway errors, three attempts per call
+    for _ in range(5):
+        with pytest.raises(Exception) as exc:
+            api.get("status/503")
+        assert not isinstance(exc.value, CircuitOpenError)
+
+    with pytest.raises(CircuitOpenError):
+        api.get("other")
+
+
+def test_json_dumps_rejects_non_finite_floats():
+    """
+    Test case for rejecting NaN and infinity in request bodies, whichever serializer is installed.
+    """
+    for value in (math.nan, math.inf, -math.inf):
+        with pytest.raises(ValueError):
+            json_dumps({"vector": [0.5, value]})
+        with pytest.raises(ValueError):
+            json_dumps({"nested": {"score": value}})
+
+    assert json_dumps({"vector": [0.5, 1], "query": None}) == b'{"vector":[0.5,1],"query":null}'
+
+
+class FakeScalar:
+    """
+    Stands in for a numpy scalar or 0-d array, whose `tolist` returns a plain number.
+    """
+
+    def __init__(self, value):
+        self.value = value
+
+    def tolist(self):
+        """
+        Returns the plain number.
+        """
+        return self.value
+
+
+def test_json_dumps_scalars():
+    """
+    Test case for serializing numpy-like scalars, and rejecting them if not finite.
+    """
+    assert json_dumps({"min_score": FakeScalar(0.7), "limit": FakeScalar(5)}) == (
+        b'{"min_score":0.7,"limit":5}'
+    )
+    with pytest.raises(ValueError):
+        json_dumps({"min_score": FakeScalar(math.nan)})
+
+
+def test_json_dumps_numpy():
+    """
+    Test case for serializing numpy scalars and arrays, including 0-d arrays, and rejecting them if not finite.
+    """
+    np = pytest.importorskip("numpy")
+
+    assert json_dumps(
+        {"score": np.float64(0.5), "limit": np.int64(5), "weight": np.array(0.25)}
+    ) == b'{"score":0.5,"limit":5,"weight":0.25}'
+    assert json_dumps({"vector": np.array([0.5, 1.0])}) == b'{"vector":[0.5,1.0]}'
+
+    for value in (np.float32("nan"), np.array(np.inf), np.array([0.5, np.nan])):
+        with pytest.raises(ValueError):
+            json_dumps({"value": value})
@@ -536,3 +536,19 @@ def test_news_text_search_with_title_promotion():
 
     assert equal_results(hybrid_results[0], hybrid_results_no_promotion[ix])
     assert matches(query, hybrid_results[0])
+
+
+def test_news_multi_search():
+    """
+    Test case for running a text and a vector news search concurrently.
+    """
+    text_results, vector_results = ds.contentstore.news.multi_search(
+        [
+            {"kind": "text", "kwargs": {"query": test_query, "max_results": 10}},
+            {"kind": "vector", "kwargs": {"query_embedding": test_embedding, "max_results": 10}},
+        ]
+    )
+
+    assert len(text_results) > 0
+    assert len(vector_results) > 0
+    assert vector_results[0].rank == 1
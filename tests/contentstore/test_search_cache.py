@@ -0,0 +1,112 @@
+# Copyright 2024 Market Logic Software AG. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+This module contains the tests for the search cache of the DeepSights ContentStore; they run offline.
+"""
+
+import threading
+from cachetools import TTLCache
+
+from deepsights.contentstore.resources.news import NewsResource
+
+
+class FakeContentStore:
+    """
+    Stands in for the ContentStore client, counting the search requests sent.
+    """
+
+    def __init__(self):
+        self.search_cache = TTLCache(maxsize=16, ttl=300)
+        self.search_cache_lock = threading.Lock()
+        self.semantic_search_cache = None
+        self.requests = []
+
+    def post(self, path, body):
+        """
+        Records the search request and returns a single result.
+        """
+        self.requests.append((path, body))
+        return {
+            "items": [
+                {
+                    "id": str(len(self.requests)),
+                    "title": "title",
+                    "description": "description",
+                    "url": "https://example.com",
+                }
+            ]
+        }
+
+
+def test_search_cache_hit():
+    """
+    Test case for answering a repeated identical search from the cache.
+    """
+    api = FakeContentStore()
+    news = NewsResource(api)
+
+    first = news.text_search(query="consumer trends")
+    second = news.text_search(query="consumer trends")
+
+    assert len(api.requests) == 1
+    assert first[0].id == second[0].id
+    assert first[0] is not second[0]
+
+
+def test_search_cache_filters():
+    """
+    Test case for sending searches that differ by their filters only.
+    """
+    api = FakeContentStore()
+    news = NewsResource(api)
+
+    news.text_search(query="consumer trends")
+    news.text_search(query="consumer trends", languages=["de"])
+    news.text_search(query="consumer trends", max_results=5)
+    news.text_search(query="consumer trends", offset=30)
+
+    assert len(api.requests) == 4
+
+
+def test_search_cache_bypass():
+    """
+    Test case for bypassing the cache per search.
+    """
+    api = FakeContentStore()
+    news = NewsResource(api)
+
+    news.text_search(query=None)
+    latest = news.text_search(query=None, use_cache=False)
+
+    assert len(api.requests) == 2
+    assert latest[0].id == "2"
+
+    # the cached response is kept
+    assert news.text_search(query=None)[0].id == "1"
+    assert len(api.requests) == 2
+
+
+def test_search_cache_disabled():
+    """
+    Test case for disabling the cache of a client.
+    """
+    api = FakeContentStore()
+    api.search_cache = None
+    news = NewsResource(api)
+
+    news.text_search(query="consumer trends")
+    news.text_search(query="consumer trends")
+
+    assert len(api.requests) == 2
@@ -0,0 +1,124 @@
+# Copyright 2024 Market Logic Software AG. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+This module contains the tests for the semantic cache of the ContentStore vector search; they run offline.
+"""
+
+import array
+import pytest
+
+from deepsights.contentstore.resources import _semantic
+from deepsights.contentstore.resources._semantic import SemanticSearchCache
+
+
+class FakeClock:
+    """
+    Stands in for the time module, advancing only when told to.
+    """
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        """
+        Returns the current fake time.
+        """
+        return self.now
+
+
+@pytest.fixture(name="clock")
+def fixture_clock(monkeypatch):
+    """
+    Replaces the time module of `_semantic` with a fake clock.
+    """
+    fake = FakeClock()
+    monkeypatch.setattr(_semantic, "time", fake)
+    return fake
+
+
+def test_semantic_cache_similar_embedding():
+    """
+    Test case for answering a search whose embedding is nearly identical to a cached one, regardless of its scale.
+    """
+    cache = SemanticSearchCache(threshold=0.98)
+    cache.put("filters", [1.0, 0.0, 0.0], ["cached"])
+
+    assert cache.get("filters", [1.0, 0.0, 0.0]) == ["cached"]
+    assert cache.get("filters", [2.0, 0.1, 0.0]) == ["cached"]
+    assert cache.get("filters", array.array("d", [1.0, 0.05, 0.0])) == ["cached"]
+
+
+def test_semantic_cache_misses():
+    """
+    Test case for not answering searches with other filters or dissimilar embeddings.
+    """
+    cache = SemanticSearchCache(threshold=0.98)
+    cache.put("filters", [1.0, 0.0, 0.0], ["cached"])
+
+    assert cache.get("other filters", [1.0, 0.0, 0.0]) is None
+    assert cache.get("filters", [1.0, 1.0, 0.0]) is None
+    assert cache.get("filters", [0.0, 0.0, 1.0]) is None
+
+
+def test_semantic_cache_best_match():
+    """
+    Test case for answering from the most similar cached search.
+    """
+    cache = SemanticSearchCache(threshold=0.9)
+    cache.put("filters", [1.0, 0.3, 0.0], ["further"])
+    cache.put("filters", [1.0, 0.1, 0.0], ["closest"])
+    cache.put("other filters", [1.0, 0.0, 0.0], ["other"])
+
+    assert cache.get("filters", [1.0, 0.0, 0.0]) == ["closest"]
+
+
+def test_semantic_cache_expiry(clock):
+    """
+    Test case for dropping cached searches after their time to live.
+    """
+    cache = SemanticSearchCache(ttl=300)
+    cache.put("filters", [1.0, 0.0], ["cached"])
+
+    clock.now += 299
+    assert cache.get("filters", [1.0, 0.0]) == ["cached"]
+
+    clock.now += 1
+    assert cache.get("filters", [1.0, 0.0]) is None
+
+
+def test_semantic_cache_max_size():
+    """
+    Test case for dropping the oldest cached searches beyond the maximum size, and for clearing the cache.
+    """
+    cache = SemanticSearchCache(max_size=2)
+    cache.put("first", [1.0, 0.0], ["first"])
+    cache.put("second", [1.0, 0.0], ["second"])
+    cache.put("third", [1.0, 0.0], ["third"])
+
+    assert cache.get("first", [1.0, 0.0]) is None
+    assert cache.get("second", [1.0, 0.0]) == ["second"]
+    assert cache.get("third", [1.0, 0.0]) == ["third"]
+
+    cache.clear()
+    assert cache.get("third", [1.0, 0.0]) is None
+
+
+def test_semantic_cache_invalid_threshold():
+    """
+    Test case for rejecting thresholds outside of (0, 1].
+    """
+    for threshold in (0, 1.5):
+        with pytest.raises(ValueError):
+            SemanticSearchCache(threshold=threshold)
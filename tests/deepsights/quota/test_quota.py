@@ -16,6 +16,7 @@
 This module contains the tests for the DeepSights API.
 """
 
+import asyncio
 import pytest
 import requests
 import deepsights
@@ -68,3 +69,31 @@ def test_ds_quota_info():
     assert r.minute_quota is not None
     assert r.minute_quota.quota_reset_at is not None
     assert r.minute_quota.quota_used >= 0
+
+
+def test_ds_profile_and_quota_async():
+    """
+    Test case for fetching the profile and the quota information concurrently.
+    """
+
+    async def _get_both():
+        return await asyncio.gather(
+            ds.quota.get_profile_async(), ds.quota.get_status_async()
+        )
+
+    profile, status = asyncio.run(_get_both())
+
+    assert profile.app is not None
+    assert profile.tenant is not None
+    assert status.day_quota is not None
+    assert status.minute_quota is not None
+
+
+def test_ds_profile_and_quota():
+    """
+    Test case for fetching the profile and the quota information at once.
+    """
+    profile, status = ds.quota.get_profile_and_status()
+
+    assert profile.app is not None
+    assert status.day_quota is not None
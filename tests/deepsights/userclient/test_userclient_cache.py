@@ -0,0 +1,171 @@
+# Copyright 2024 Market Logic Software AG. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+This module contains the tests for the user client cache of the DeepSights client; they run offline.
+"""
+
+import json
+import time
+import base64
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import deepsights
+from deepsights.userclient import UserClient
+from deepsights.api import _transport as transport_module
+from deepsights.deepsights import deepsights as deepsights_module
+
+
+def make_token(**claims):
+    """
+    Creates an unsigned JWT with the given claims.
+    """
+    payload = base64.urlsafe_b64encode(json.dumps(claims).encode()).rstrip(b"=")
+    return f"header.{payload.decode()}.signature"
+
+
+class FakeIdentityResolver:
+    """
+    Stands in for the MIP identity resolver, counting the token requests and taking a while to answer them.
+    """
+
+    def __init__(self, token="token", delay=0.2):
+        self.token = token
+        self.delay = delay
+        self.requests = []
+        self._lock = threading.Lock()
+
+    def get_oauth_token(self, user_email):
+        """
+        Records the token request and answers it after the delay.
+        """
+        with self._lock:
+            self.requests.append(user_email)
+        time.sleep(self.delay)
+        return self.token
+
+
+@pytest.fixture(name="ds")
+def fixture_ds(monkeypatch):
+    """
+    Creates a DeepSights client that opens no connections ahead of time to the real hosts.
+    """
+    monkeypatch.setattr(transport_module, "warm_up", lambda session, endpoint_base: None)
+
+    return deepsights.DeepSights(
+        ds_api_key="ds-key", cs_api_key="cs-key", mip_api_key="mip-key"
+    )
+
+
+def test_userclient_cached(ds):
+    """
+    Test case for reusing the user client of a user, with the email normalized.
+    """
+    ds._mip_identity_resolver = FakeIdentityResolver(delay=0)  # pylint: disable=protected-access
+
+    first = ds.get_userclient("John.Doe@acme.com")
+    second = ds.get_userclient(" john.doe@acme.com ")
+
+    assert first is second
+    assert ds._mip_identity_resolver.requests == ["john.doe@acme.com"]  # pylint: disable=protected-access
+
+
+def test_userclient_single_flight(ds):
+    """
+    Test case for sharing one token request among concurrent calls for the same user.
+    """
+    resolver = ds._mip_identity_resolver = FakeIdentityResolver()
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        userclients = list(
+            executor.map(ds.get_userclient, ["john.doe@acme.com"] * 8 + ["jane.doe@acme.com"])
+        )
+
+    assert sorted(resolver.requests) == ["jane.doe@acme.com", "john.doe@acme.com"]
+    assert all(userclient is userclients[0] for userclient in userclients[:8])
+    assert userclients[8] is not userclients[0]
+
+
+def test_userclient_single_flight_error(ds):
+    """
+    Test case for raising a failed token request to all concurrent callers, and retrying on the next call.
+    """
+    resolver = ds._mip_identity_resolver = FakeIdentityResolver(token=None)
+
+    def get_userclient(user_email):
+        try:
+            return ds.get_userclient(user_email)
+        except ValueError as e:
+            return e
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        errors = list(executor.map(get_userclient, ["john.doe@acme.com"] * 4))
+
+    assert all(isinstance(error, ValueError) for error in errors)
+    assert len(resolver.requests) == 1
+
+    resolver.token = "token"
+    assert ds.get_userclient("john.doe@acme.com") is not None
+    assert len(resolver.requests) == 2
+
+
+@pytest.mark.usefixtures("ds")
+def test_userclient_token_expiry():
+    """
+    Test case for reading the expiry of a user client's token, if it is a JWT with an "exp" claim.
+    """
+    assert UserClient(make_token(exp=1767225600)).token_expiry == 1767225600
+    assert UserClient(make_token(sub="user")).token_expiry is None
+    assert UserClient("opaque-token").token_expiry is None
+
+
+@pytest.mark.usefixtures("ds")
+def test_userclient_ttu():
+    """
+    Test case for keeping user clients for the default time, but not beyond shortly before their token expires.
+    """
+    ttu = deepsights_module._userclient_ttu  # pylint: disable=protected-access
+    now = 500.0
+
+    # no expiry known
+    assert ttu("user", UserClient("opaque-token"), now) == now + 240
+
+    # expiring later than the default time
+    token = make_token(exp=time.time() + 3600)
+    assert ttu("user", UserClient(token), now) == now + 240
+
+    # expiring sooner, so dropped 30 seconds ahead
+    token = make_token(exp=time.time() + 120)
+    assert ttu("user", UserClient(token), now) == pytest.approx(now + 90, abs=1)
+
+    # about to expire, so never handed out
+    token = make_token(exp=time.time() + 10)
+    assert ttu("user", UserClient(token), now) < now
+
+
+def test_userclient_expiring_token_not_cached(ds):
+    """
+    Test case for not handing out cached user clients whose token is about to expire.
+    """
+    resolver = ds._mip_identity_resolver = FakeIdentityResolver(
+        token=make_token(exp=time.time() + 10), delay=0
+    )
+
+    ds.get_userclient("john.doe@acme.com")
+    ds.get_userclient("john.doe@acme.com")
+
+    assert len(resolver.requests) == 2
@@ -73,3 +73,19 @@ def test_document_download():
     assert os.path.exists(local_filename)
 
     os.remove(local_filename)
+
+
+def test_documents_download_many():
+    """
+    Test case for downloading several documents at once.
+    """
+    local_filenames = ds.documentstore.documents.download_many(
+        [test_document_id],
+        tempfile.gettempdir(),
+        force_download=True,
+    )
+
+    assert len(local_filenames) == 1
+    assert os.path.exists(local_filenames[0])
+
+    os.remove(local_filenames[0])
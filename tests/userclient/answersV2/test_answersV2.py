@@ -18,6 +18,7 @@ This module contains the tests for the answer retrieval functions.
 
 import os
 import json
+import asyncio
 import pytest
 import deepsights
 
@@ -94,6 +95,33 @@ def test_answerV2_create_and_wait():
     _check_answer(answer)
 
 
+def test_answerV2_create_and_wait_async():
+    """
+    Submit questions concurrently and wait for the answers.
+    """
+
+    async def _create_and_wait_all():
+        return await asyncio.gather(
+            uc.answersV2.create_and_wait_async(test_question, timeout=90),
+            uc.answersV2.create_and_wait_async(test_question, timeout=90),
+        )
+
+    for answer in asyncio.run(_create_and_wait_all()):
+        _check_answer(answer)
+
+
+def test_answerV2_create_many():
+    """
+    Submit questions concurrently and check the IDs are returned in order.
+    """
+    answer_ids = uc.answersV2.create_many([test_question, test_question])
+
+    assert len(answer_ids) == 2
+    assert answer_ids[0] != answer_ids[1]
+    for answer_id in answer_ids:
+        assert uc.answersV2.wait_for_answer(answer_id, timeout=90).id == answer_id
+
+
 def test_answerV2_create_and_wait_briefly():
     """
     Test function to check the behavior of the answer_wait_for_completion function.
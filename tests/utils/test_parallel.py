@@ -0,0 +1,90 @@
+# Copyright 2024 Market Logic Software AG. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+This module contains the tests for the parallel runs of the DeepSights API; they run offline.
+"""
+
+import time
+import threading
+
+import pytest
+
+from deepsights.utils import run_in_parallel
+from deepsights.utils import _utils
+
+
+def test_parallel_results_in_order():
+    """
+    Test case for returning the results in the order of the arguments.
+    """
+    def slow_square(x):
+        time.sleep(0.01 * (5 - x))
+        return x * x
+
+    assert run_in_parallel(slow_square, range(5), max_workers=5) == [0, 1, 4, 9, 16]
+    assert run_in_parallel(slow_square, [3], max_workers=5) == [9]
+    assert run_in_parallel(slow_square, [], max_workers=5) == []
+
+
+def test_parallel_first_error():
+    """
+    Test case for raising the error of the first failed argument, after all arguments are processed.
+    """
+    processed = []
+
+    def fail_on_odd(x):
+        processed.append(x)
+        if x % 2:
+            raise ValueError(x)
+        return x
+
+    with pytest.raises(ValueError) as exc:
+        run_in_parallel(fail_on_odd, range(6), max_workers=3)
+
+    assert exc.value.args == (1,)
+    assert sorted(processed) == list(range(6))
+
+
+def test_parallel_nested_inline():
+    """
+    Test case for running nested parallel runs inline on the worker threads.
+    """
+    def inner(x):
+        return run_in_parallel(lambda y: (x, y, threading.current_thread()), range(3))
+
+    for results in run_in_parallel(inner, range(4), max_workers=4):
+        assert len({thread for _, _, thread in results}) == 1
+
+
+def test_parallel_saturated_pool():
+    """
+    Test case for finishing a run on the calling thread when all shared workers are busy with other runs.
+    """
+    # occupy every thread of the shared pool, which is private to the module
+    executor = _utils._get_executor()  # pylint: disable=protected-access
+    release = threading.Event()
+    blockers = [
+        executor.submit(release.wait, 10)
+        for _ in range(_utils._EXECUTOR_THREADS)  # pylint: disable=protected-access
+    ]
+
+    try:
+        start = time.monotonic()
+        assert run_in_parallel(lambda x: x + 1, range(10), max_workers=5) == list(range(1, 11))
+        assert time.monotonic() - start < 1
+    finally:
+        release.set()
+        for blocker in blockers:
+            blocker.result()